@@ -0,0 +1,69 @@
+'''
+Count the Tcl calls made per motion event while dragging the marker of a
+Colorscale. Needs a display.
+
+Usage:
+    python benchmarks/bench_move_marker.py [TREE ...]
+
+Every TREE is a checkout of tkmacosx (default: this one), each is measured
+in its own process. To compare with the code before the persistent
+canvas items (3a7ce1d):
+
+    git worktree add /tmp/tkmacosx-before 3a7ce1d^
+    python benchmarks/bench_move_marker.py /tmp/tkmacosx-before .
+'''
+
+import os
+import subprocess
+import sys
+
+
+class _CallCounter:
+    "Internal class. Counts the Tcl calls made through a tkapp."
+    def __init__(self, tk):
+        self._tk = tk
+        self.calls = 0
+    def call(self, *args):
+        self.calls += 1
+        return self._tk.call(*args)
+    def __getattr__(self, name):
+        return getattr(self._tk, name)
+
+
+def bench_move_marker(n=200):
+    """Drag the marker of a Colorscale `n` times and return the number of
+    Tcl calls made per motion event."""
+    import tkinter as tk
+    from tkmacosx.colorscale import Colorscale
+    root = tk.Tk()
+    CS = Colorscale(root, value='hex')
+    CS.pack()
+    root.update()
+    # Font() goes through the default root, count its calls too.
+    counter = root.tk = CS.tk = _CallCounter(CS.tk)
+    class Event: pass
+    width, height = CS.winfo_width(), CS.winfo_height()
+    counter.calls = 0
+    for i in range(n):
+        evt = Event()
+        evt.x, evt.y = 1 + i % (width-2), height//2
+        CS.move_marker(evt)
+    calls = counter.calls / float(n)
+    root.tk = CS.tk = counter._tk
+    root.destroy()
+    return calls
+
+
+def main(trees):
+    for tree in trees or [os.path.join(os.path.dirname(__file__), os.pardir)]:
+        tree = os.path.abspath(tree)
+        out = subprocess.check_output([sys.executable, __file__, '--run'],
+            env=dict(os.environ, PYTHONPATH=tree), universal_newlines=True)
+        print('{}: {} Tcl calls per motion event'.format(tree, out.strip()))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ['--run']:
+        print(bench_move_marker())
+    else:
+        main(sys.argv[1:])
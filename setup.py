@@ -37,7 +37,7 @@ setup(
     keywords=['tkinter', 'macos', 'variable', 'widgets', 'colorscale', 'tk'],
     packages=["tkmacosx"],
     include_package_data=True,
-    install_requires=['colour', 'pillow'],
+    install_requires=['pillow', 'numpy'],
     project_urls={  # Optional
         'Bug Reports': 'https://github.com/Saadmairaj/tkmacosx',
         'Source': 'https://github.com/Saadmairaj/tkmacosx/issues',
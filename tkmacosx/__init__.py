@@ -22,8 +22,10 @@ Read more about tkmacosx in detail on
 https://github.com/Saadmairaj/tkmacosx/tree/master/tkmacosx.
 """
 
-from tkmacosx.basewidget import check_appearence, get_shade
-from tkmacosx.variables import ColorVar, DictVar, demo_colorvar, SaveVar, demo_savevar
+from tkmacosx.basewidget import check_appearence, get_shade, get_shades, AppearanceMonitor
+from tkmacosx.variables import (ColorVar, DictVar, demo_colorvar, SaveVar, demo_savevar,
+                                enable_colorvar, disable_colorvar, colorvar_scope,
+                                SaveStore, flush_savevar)
 from tkmacosx.widget import Button, SFrame, demo_sframe, demo_button, demo_marquee, Marquee
 from tkmacosx.colors import Hex, OrderedHex
 from tkmacosx.colorscale import Colorscale, demo_colorscale
@@ -13,32 +13,142 @@
 #    limitations under the License.
 
 from tkinter import ttk
+from collections import OrderedDict
+from functools import lru_cache
+from contextlib import contextmanager
 import tkinter as _TK
+from PIL import Image, ImageTk
 import re
 import subprocess
+import threading
+import queue
+import time
+import weakref
+import numpy as np
+import tkmacosx.colors as colors
 
-try: 
-    import colour as C
-except Exception as e:
-    import sys, os
-    import tkinter.messagebox as ms
-    Error_win = _TK.Tk()
-    Error_win.withdraw()
-    message = """
-    Module "tkmacosx" is dependent on 
-    "colour" Module. 
-
-    Do you want to install it with pip now?
-    Or install it manually later.
-    
-    Link to the colour github:
-    https://github.com/vaab/colour"""
-    if ms._show(e, message, 'warning', 'yesno')=='yes':
-        Error_win.destroy()
-        os.system('pip install colour')
-        import colour as C
-    else: 
-        sys.exit(0)
+def _run_command(cmd):
+    "Internal function. Runs `cmd` in a shell and returns (stdout, stderr)."
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            universal_newlines=True, shell=True).communicate()
+
+
+class AppearanceMonitor:
+    """### Watches DARK/LIGHT mode of macos.
+    The mode is cached for `ttl` seconds so it can be polled freely. After
+    `start()` a background thread keeps checking the mode and the callbacks
+    are called on the Tk thread, only when the mode actually changes.
+
+    #### Args:
+    - `master`: Widget whose Tk thread runs the callbacks. If not given the
+        callbacks are called from the watcher thread.
+    - `ttl`: Seconds for which a checked mode is reused.
+    - `interval`: Seconds between two checks of the watcher thread.
+    - `cmd`: Command which checks the mode.
+    - `runner`: Function which takes `cmd` and returns `(stdout, stderr)`.
+        Give a stub to use it without macos.
+
+    #### Example:
+        root = tk.Tk()
+        monitor = AppearanceMonitor(root)
+        monitor.add_callback(lambda dark: print('DARK' if dark else 'LIGHT'))
+        monitor.start()
+        root.mainloop()
+    """
+
+    _poll_ms = 100  # How often the Tk thread looks for a mode change.
+
+    def __init__(self, master=None, ttl=1.0, interval=2.0,
+                cmd='defaults read -g AppleInterfaceStyle', runner=None):
+        self.master = master
+        self.ttl = ttl
+        self.interval = interval
+        self.cmd = cmd
+        self.runner = runner or _run_command
+        self._value = None
+        self._checked = None
+        self._current = None
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self._changes = queue.Queue()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._after_id = None
+
+    def get(self, refresh=False):
+        """Return True if DARK mode, False if LIGHT mode.
+        Runs the command only if the cached mode is older than `ttl`
+        or `refresh` is True."""
+        with self._lock:
+            now = time.monotonic()
+            if refresh or self._checked is None or now - self._checked >= self.ttl:
+                out, err = self.runner(self.cmd)
+                self._value = True if out else False if err else None
+                self._checked = now
+            return self._value
+
+    def add_callback(self, func):
+        """Call `func(dark)` whenever the mode changes."""
+        if func not in self._callbacks:
+            self._callbacks.append(func)
+
+    def remove_callback(self, func):
+        """Remove a callback added with `add_callback`."""
+        if func in self._callbacks:
+            self._callbacks.remove(func)
+
+    def is_running(self):
+        """Return True if the watcher thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the watcher thread."""
+        if self.is_running(): return
+        self._current = self.get()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._watch, daemon=True,
+                                        name='AppearanceMonitor')
+        self._thread.start()
+        if self.master is not None:
+            self._after_id = self.master.after(self._poll_ms, self._poll)
+
+    def stop(self):
+        """Stop the watcher thread."""
+        self._stopped.set()
+        if self._after_id is not None:
+            self.master.after_cancel(self._after_id)
+            self._after_id = None
+        self._thread = None
+
+    def _watch(self):
+        "Internal function. Loop of the watcher thread."
+        last = self._current
+        while not self._stopped.wait(self.interval):
+            value = self.get(refresh=True)
+            if value == last: continue
+            last = value
+            if self.master is None: self._dispatch(value)
+            else: self._changes.put(value)
+
+    def _poll(self):
+        "Internal function. Moves the changes found by the thread to the Tk thread."
+        try:
+            while True:
+                self._dispatch(self._changes.get_nowait())
+        except queue.Empty:
+            pass
+        if not self._stopped.is_set():
+            self._after_id = self.master.after(self._poll_ms, self._poll)
+
+    def _dispatch(self, value):
+        "Internal function. Calls the callbacks if the mode changed."
+        if value == self._current: return
+        self._current = value
+        for func in list(self._callbacks):
+            func(value)
+
+
+_appearance_monitors = {}
 
 
 def check_appearence(cmd='defaults read -g AppleInterfaceStyle'):
@@ -46,10 +156,90 @@ def check_appearence(cmd='defaults read -g AppleInterfaceStyle'):
     #### Args:
     - `cmd`: Give commands. Like to check DARK/LIGHT mode the command is `'defaults read -g AppleInterfaceStyle'` .
     """
-    out, err = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-            universal_newlines=True, shell=True).communicate()
-    if out: return True
-    elif err: return False
+    monitor = _appearance_monitors.get(cmd)
+    if monitor is None:
+        monitor = _appearance_monitors[cmd] = AppearanceMonitor(cmd=cmd)
+    return monitor.get()
+
+
+class _LRUCache(OrderedDict):
+    """Internal class. Dictionary which holds at most `maxsize`
+    items, dropping the least recently used item when full.
+    `get` and setting an item are thread-safe."""
+
+    def __init__(self, maxsize=128, seed=None):
+        super(_LRUCache, self).__init__()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        if seed: self.update(seed)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self[key]
+            except KeyError:
+                return default
+            self.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super(_LRUCache, self).__setitem__(key, value)
+            self.move_to_end(key)
+            if len(self) > self.maxsize:
+                self.popitem(last=False)
+
+
+def _hex_to_rgb(Hex):
+    "Internal function. Convert '#rrggbb' to a RGB tuple."
+    Hex = Hex.lstrip('#')
+    return tuple( int(Hex[i:i+2], 16) for i in (0, 2, 4) )
+
+
+def _normalize_name(color):
+    "Internal function. Color names are looked up in lowercase without spaces."
+    return color.replace(' ', '').lower()
+
+
+# Color name  ---->  (R, G, B), the same as Tk gives.
+_rgb_table = { name: _hex_to_rgb(Hex) for name, Hex in
+               list(colors.Hex.items()) + list(colors.X11Hex.items()) }
+# Color name or HEX  ---->  (R, G, B)
+_rgb_cache = _LRUCache(1024)
+# (color, shade, mode)  ---->  hexcode
+_shade_cache = _LRUCache(2048)
+
+
+def _get_rgb(color, widget=None, new_root=True):
+    """Internal function. Returns (R, G, B) of a color name or HEX.
+
+    Only asks Tk (through `widget` or the default root) for the colors
+    which are not in the color tables. Without both, a Tk root is made
+    if `new_root` is True else ValueError is raised. System colors (eg:
+    "systemWindowBackgroundColor") change with the appearance of macos
+    so they are never cached."""
+    rgb = _rgb_cache.get(color)
+    if rgb is not None: return rgb
+    if color.startswith('#') and len(color) == 7:
+        rgb = _hex_to_rgb(color)
+    else:
+        rgb = _rgb_table.get(_normalize_name(color))
+        if rgb is not None: return rgb
+    if rgb is None:
+        if widget is not None:
+            r,g,b = widget.winfo_rgb(color)
+        elif _TK._default_root is not None:
+            r,g,b = _TK._default_root.winfo_rgb(color)
+        elif not new_root:
+            raise ValueError('No Tk root to look up "{}".'.format(color))
+        else:
+            tmp = _TK.Frame()
+            r,g,b = tmp.winfo_rgb(color)
+            tmp.destroy()
+        rgb = (r/257, g/257, b/257)
+        if color.lower().startswith('system'): return rgb
+    _rgb_cache[color] = rgb
+    return rgb
 
 
 def get_shade(color, shade: float, mode='auto'):
@@ -63,15 +253,13 @@ def get_shade(color, shade: float, mode='auto'):
         - `'auto-110'` automatically decide lighter or darker. where 110 is the intensity.
     
     return hexcode"""
+    if isinstance( color, list ): color = tuple(color)
+    key = (color, shade, mode)
+    result = _shade_cache.get(key)
+    if result is not None: return result
+    dynamic = isinstance(color, str) and color.lower().startswith('system')
     if isinstance( color, str ):
-        if color.startswith('#'):
-            Hex = color.lstrip('#')
-            color = tuple( int(Hex[i:i+2], 16) for i in (0, 2, 4) )
-        else:  
-            tmp = _TK.Frame()
-            r,g,b = tmp.winfo_rgb(color)
-            tmp.destroy()
-            color = (r/257, g/257, b/257)
+        color = _get_rgb(color)
     if 'auto' in mode:
         intensity = 110.0 if len(mode)<=4 else float(mode.split('-')[1])
         mode = '-' if float(color[0]*0.299 + color[1]*0.587 \
@@ -91,7 +279,202 @@ def get_shade(color, shade: float, mode='auto'):
         B = float(color[2]*(1-shade) - shade*255) \
                 if float(color[2]*(1-shade) - shade*255) > 0 else 0.0
     else: raise ValueError ('Invalid mode "{}"'. format(mode))
-    return '#%02x%02x%02x' % (int(R),int(G),int(B))  
+    result = '#%02x%02x%02x' % (int(R),int(G),int(B))
+    if not dynamic: _shade_cache[key] = result
+    return result
+
+
+_hex_digits = np.array(['%02x' % i for i in range(256)])
+
+
+def get_shades(colors, shades, mode='auto'):
+    """### Darken or Lighten many colors at once.
+    Same as `get_shade` but works on arrays, every color is shaded in
+    one pass. `colors`, `shades` and `mode` are broadcasted against
+    each other like NumPy arrays.
+    #### Args:
+    1. `colors`: Give a list of HEX or names of the colors, or an array
+        of RGB values with shape (..., 3).
+    2. `shades`: The amount of change required. Takes float or list of floats.
+    3. `mode`: `'-'`, `'+'` or `'auto-110'` same as `get_shade`. Takes a
+        string or list of strings.
+
+    return array of hexcodes"""
+    if isinstance( colors, str ): colors = [colors]
+    colors = np.asarray(colors)
+    if colors.dtype.kind in 'US':
+        names, index = np.unique(colors, return_inverse=True)
+        rgb = np.array([ _get_rgb(str(name)) for name in names ], dtype=float)
+        rgb = rgb[index].reshape(colors.shape + (3,))
+    else:
+        rgb = colors.astype(float)
+    shades = np.asarray(shades, dtype=float)[..., None]
+
+    mode = np.asarray(mode)
+    sign = np.empty(mode.shape)
+    intensity = np.full(mode.shape, np.nan)
+    for m in np.unique(mode):
+        m = str(m)
+        if 'auto' in m:
+            intensity[mode == m] = 110.0 if len(m)<=4 else float(m.split('-')[1])
+        elif m in ('+', '-'):
+            sign[mode == m] = 1.0 if m == '+' else -1.0
+        else: raise ValueError ('Invalid mode "{}"'. format(m))
+    auto = ~np.isnan(intensity)
+    if auto.any():
+        luma = rgb[..., 0]*0.299 + rgb[..., 1]*0.587 + rgb[..., 2]*0.114
+        sign = np.where(auto, np.where(luma > intensity, -1.0, 1.0), sign)
+
+    res = rgb*(1-shades) + sign[..., None]*shades*255
+    res = np.clip(res, 0, 255).astype(int)
+    return np.char.add(np.char.add(np.char.add('#',
+        _hex_digits[res[..., 0]]), _hex_digits[res[..., 1]]), _hex_digits[res[..., 2]])
+
+
+def _rgb_to_hsl(rgb):
+    """Internal function. Convert an array of RGB (0 to 1) with shape
+    (..., 3) to HSL (0 to 1)."""
+    rgb = np.asarray(rgb, dtype=float)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    vmin, vmax = rgb.min(-1), rgb.max(-1)
+    diff, vsum = vmax - vmin, vmax + vmin
+    l = vsum/2
+    gray = diff < 0.0000005
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(l < 0.5, diff/vsum, diff/(2.0-vsum))
+        dr = ((vmax-r)/6 + diff/2)/diff
+        dg = ((vmax-g)/6 + diff/2)/diff
+        db = ((vmax-b)/6 + diff/2)/diff
+    h = np.where(r == vmax, db-dg, np.where(g == vmax,
+                1.0/3 + dr-db, 2.0/3 + dg-dr))
+    h = np.where(h < 0, h+1, np.where(h > 1, h-1, h))
+    return np.stack((np.where(gray, 0.0, h), np.where(gray, 0.0, s), l), -1)
+
+
+def _hsl_to_rgb(hsl):
+    """Internal function. Convert an array of HSL (0 to 1) with shape
+    (..., 3) to RGB (0 to 1)."""
+    hsl = np.asarray(hsl, dtype=float)
+    h, s, l = hsl[..., 0], hsl[..., 1], hsl[..., 2]
+    v2 = np.where(l < 0.5, l*(1.0+s), (l+s) - (s*l))
+    v1 = 2.0*l - v2
+    def hue2rgb(vH):
+        vH = vH % 1.0
+        return np.where(6*vH < 1, v1 + (v2-v1)*6*vH, np.where(2*vH < 1, v2,
+            np.where(3*vH < 2, v1 + (v2-v1)*((2.0/3)-vH)*6, v1)))
+    rgb = np.stack((hue2rgb(h + 1.0/3), hue2rgb(h), hue2rgb(h - 1.0/3)), -1)
+    return np.where((s == 0)[..., None], l[..., None], rgb)
+
+
+# (tk, start color, end color, width, height)  ---->  PhotoImage
+_gradient_cache = _LRUCache(64)
+
+
+def _gradient(master, start, end, width, height):
+    """Internal function. Returns a PhotoImage of a vertical gradient from 
+    `start` to `end` color. Gradients of the same colors and size are 
+    shared. The colors move through HSL like `colour.Color.range_to`."""
+    width, height = max(int(width), 1), max(int(height), 1)
+    key = (master.tk, start, end, width, height)
+    image = _gradient_cache.get(key)
+    if image is not None: return image
+    hsl = _rgb_to_hsl(np.array([_get_rgb(start), _get_rgb(end)])/255)
+    step = (hsl[1]-hsl[0])/(height-1) if height > 1 else hsl[0]*0
+    rows = _hsl_to_rgb(hsl[0] + step*np.arange(height)[:, None])
+    # Same rounding as colour.rgb2hex.
+    rows = (rows*255 + 0.5 - 0.0000001).astype(np.uint8)
+    pixels = np.ascontiguousarray(np.broadcast_to(rows[:, None], (height, width, 3)))
+    image = _gradient_cache[key] = ImageTk.PhotoImage(
+                    Image.fromarray(pixels, 'RGB'), master=master)
+    return image
+
+
+# tk  ---->  (chrome width, chrome height, default font, minimum characters)
+_button_chrome_cache = {}
+# (tk, text, font, padding, compound, image size)  ---->  (width, height)
+_size_cache = _LRUCache(1024)
+
+
+@lru_cache(maxsize=512)
+def _rounded_rect_points(x, y, w, h, c):
+    """Internal function. Points of a smoothed polygon which draws a
+    rectangle with round corners of radius `c`."""
+    return (x+c, y,     x+c, y,     x+w-c, y,   x+w-c, y,   x+w, y,
+            x+w, y+c,   x+w, y+c,   x+w, y+h-c, x+w, y+h-c, x+w, y+h,
+            x+w-c, y+h, x+w-c, y+h, x+c, y+h,   x+c, y+h,   x, y+h,
+            x, y+h-c,   x, y+h-c,   x, y+c,     x, y+c,     x, y)
+
+
+class _WidgetRegistry:
+    """Internal class. Keeps weak references of widgets indexed by
+    their master. A widget is dropped when it is destroyed or collected."""
+
+    def __init__(self):
+        self._masters = weakref.WeakKeyDictionary()  # master -> WeakSet
+
+    def add(self, widget):
+        "Add `widget` under its master."
+        self._masters.setdefault(widget.master, weakref.WeakSet()).add(widget)
+
+    def discard(self, widget):
+        "Remove `widget` if present."
+        children = self._masters.get(widget.master)
+        if children is None: return
+        children.discard(widget)
+        if not children: self._masters.pop(widget.master, None)
+
+    def children(self, master):
+        "Return a list of the widgets of `master`."
+        return list(self._masters.get(master, ()))
+
+    def __iter__(self):
+        for children in list(self._masters.values()):
+            yield from list(children)
+
+    def __len__(self):
+        return sum(len(children) for children in self._masters.values())
+
+
+class _FocusDispatcher:
+    """Internal class. Handles <FocusIn> and <FocusOut> of a toplevel
+    for all of its buttons with one binding. Buttons are only restyled
+    when the window gains or loses focus."""
+
+    _dispatchers = weakref.WeakKeyDictionary()  # toplevel -> dispatcher
+
+    @classmethod
+    def register(cls, widget):
+        "Add `widget` to the dispatcher of its toplevel and return the dispatcher."
+        toplevel = widget.winfo_toplevel()
+        dispatcher = cls._dispatchers.get(toplevel)
+        if dispatcher is None:
+            dispatcher = cls._dispatchers[toplevel] = cls(toplevel)
+        dispatcher.buttons.add(widget)
+        widget._set_dimmed(dispatcher.active is False)
+        return dispatcher
+
+    def __init__(self, toplevel):
+        # Weak, `_dispatchers` is keyed by the toplevel.
+        self._toplevel = weakref.ref(toplevel)
+        self.buttons = weakref.WeakSet()
+        self.active = None
+        toplevel.bind_class(toplevel, '<FocusIn>', self._on_focus, '+')
+        toplevel.bind_class(toplevel, '<FocusOut>', self._on_focus, '+')
+
+    @property
+    def toplevel(self):
+        "Toplevel of the dispatcher."
+        return self._toplevel()
+
+    def _on_focus(self, evt=None):
+        "Internal function."
+        toplevel = self.toplevel
+        if toplevel is None: return
+        active = toplevel.focus_get() is not None
+        if active == self.active: return
+        self.active = active
+        for button in list(self.buttons):
+            button._set_dimmed(not active)
 
 
 class _Frame(_TK.BaseWidget):
@@ -177,38 +560,31 @@ class _Canvas(_TK.Widget):
         (optional above another item)."""
         self.tk.call((self._w, 'raise') + args)
     lift = tkraise = tag_raise
+    def _polygon(self, *args, **kw):
+        """Create polygon with coordinates x1,y1,...,xn,yn."""
+        return self._create('polygon', args, kw)
     def rounded_rect(self, x, y, w, h, c, tag1=None, tag2=None, **kw):
-        'Internal function.'
-        # Need fix to just have one tag to change the background color
-        kw['extent'] = 90
-        kw['style'] = 'arc'
+        """Internal function. Draws the outline of a rounded rectangle as one
+        smoothed polygon and returns its id. `fill` is the color of the outline,
+        change it later with `outline`. The item gets both `tag1` and `tag2`."""
         kw['outline'] = kw.pop('fill', 'black')
-        if tag1: kw['tag'] = tag1
-        self._arc(x,   y,   x+2*c,   y+2*c,   start= 90, **kw)
-        self._arc(x+w-2*c, y+h-2*c, x+w, y+h, start=270, **kw)
-        self._arc(x+w-2*c, y,   x+w, y+2*c,   start=  0, **kw)
-        self._arc(x,   y+h-2*c, x+2*c,   y+h, start=180, **kw)
-        kw.pop('extent', None)
-        kw.pop('style', None)
-        kw['fill'] = kw.pop('outline', None)
-        if tag2: kw['tag'] = tag2
-        self._line(x+c, y,   x+w-c, y    , **kw)
-        self._line(x+c, y+h, x+w-c, y+h  , **kw)
-        self._line(x,   y+c, x,     y+h-c, **kw)
-        self._line(x+w, y+c, x+w,   y+h-c, **kw)
+        kw['fill'] = ''
+        if tag1 or tag2: kw['tag'] = tuple(t for t in (tag1, tag2) if t)
+        return self._polygon(_rounded_rect_points(x, y, w, h, c), smooth=1, **kw)
+    def coords_rounded_rect(self, item, x, y, w, h, c):
+        'Internal function. Moves the item made by `rounded_rect` to new coordinates.'
+        self.coords(item, *_rounded_rect_points(x, y, w, h, c))
     def _rounded(self, x1, y1, x2, y2, r,**kw):
-        self._arc(x1,  y1,  x1+r,   y1+r, start= 90, extent=90, style='pieslice', outline="", **kw)
-        self._arc(x2-r-1, y1, x2-1, y1+r, start=  0, extent=90, style='pieslice', outline="", **kw)
-        self._arc(x1, y2-r-1, x1+r, y2-1, start=180, extent=90, style='pieslice', outline="", **kw)
-        self._arc(x2-r, y2-r, x2-1, y2-1, start=270, extent=90, style='pieslice', outline="", **kw)
-        self._rectangle(x1+r/2, y1, x2-r/2, y2, width=0, **kw)
-        self._rectangle(x1, y1+r/2, x2, y2-r/2, width=0, **kw)
+        """Internal function. Draws a filled rounded rectangle as one
+        smoothed polygon and returns its id."""
+        return self._polygon(_rounded_rect_points(x1, y1, x2-x1, y2-y1, r/2),
+                             smooth=1, outline="", width=0, **kw)
 
 
 class Widget(_Canvas):
     """Internal class used for tkinter macos Buttton"""
 
-    _buttons = []  # list of all buttons
+    _buttons = _WidgetRegistry()  # all the buttons, by master
     _features =  [  'activebackground', 'activeforeground', 'activeimage', 'activebitmap', 'anchor', 'bitmap', 
                     'borderwidth', 'bd', 'bordercolor', 'borderless', 'command', 'compound', 'disabledforeground', 
                     'disabledbackground', 'fg', 'font', 'foreground', 'height', 'image', 'overrelief', 'padx', 
@@ -217,7 +593,12 @@ class Widget(_Canvas):
     def __init__(self, master=None, cnf={}, **kw):
         kw = _TK._cnfmerge( (cnf, kw) )
         kw = { k:v for k,v in kw.items() if v is not None }
-        self.stopped = None
+        self._resize_id = None
+        self._shapes = None
+        self._pending_cnf = {}
+        self._pending_id = None
+        self._batch_depth = 0
+        self._textvar_trace = None
         self.cnf = {}
         for i in kw.copy().keys():
             if i in self._features: self.cnf[i] = kw.pop(i, None)
@@ -235,7 +616,7 @@ class Widget(_Canvas):
         kw['height'] = kw.get('height', 24)
 
         super(Widget, self).__init__(master=master, **kw)
-        self._buttons.append(self)
+        self._buttons.add(self)
         self._size = (self.winfo_width(), self.winfo_height())
         if self.cnf.get('text'): self._text(0,0,text=None, tag='_txt')
         if self.cnf.get('image'): self._image(0,0,image=None, tag='_img')
@@ -243,54 +624,95 @@ class Widget(_Canvas):
         self.bind_class('button_release', '<ButtonRelease-1>', self.on_release, '+')
         self.bind_class('button_press', '<Button-1>', self.on_press, '+' )
         self.bind_class('set_size', '<Configure>', self._set_size, '+')
+        self.bind_class('on_destroy', '<Destroy>', self._on_destroy, '+')
         self.original_bg = self['bg']
 
         #  Focus in and out effect 
-        main_win =  self.winfo_toplevel()
-        def _chngIn(evt):
-            if self.focus_get() is None:
-                color = get_shade(self['bg'], 0.04, 'auto-120')
-                self.itemconfig('_border1', outline=color)
-                self.itemconfig('_border2', fill=color)
-            if self.focus_get() and get_shade(self['bg'], 0.04, 'auto-120') == self.itemcget('_border2','fill'):
-                color = get_shade(self['bg'], 0.1, 'auto-120')
-                self.itemconfig('_border1', outline=color)
-                self.itemconfig('_border2', fill=color)
-        main_win.bind_class(main_win,'<FocusIn>', _chngIn, '+')
-        main_win.bind_class(main_win,'<FocusOut>', _chngIn, '+')
+        self._dimmed = False
+        self._focus = _FocusDispatcher.register(self)
         self._getconfigure2(self.cnf)
 
-    def _set_size(self, *ags):
-        """Internal function. This will resize everything that is in the button"""
-        if ags[0].width == self._size[0] and ags[0].height == self._size[1]: return
-        self._size = (ags[0].width, ags[0].height)
-        self.delete('_bd_color1')
-        self.delete('_bd_color2')
-        self.delete('_border1')
-        self.delete('_border2')
-        self.delete('_tf')
-        # Need fix (laggy on resizing) ----> workaround: cancel if still resizing 
-        if self.stopped: self.after_cancel(self.stopped)
-        self.stopped = self.after(50, lambda: self.on_press_color(tag='_activebg', 
-            width=ags[0].width, height=ags[0].height,color=self.cnf.get('activebackground'))  )
-        self.rounded_rect(0, -1, ags[0].width, ags[0].height+3, 6, width=self.cnf.get('bd',6), fill=self.cnf.get('bordercolor', 
-                get_shade(self['bg'], 0.04, 'auto-120')), tag1='_bd_color1', tag2='_bd_color2')
-        self.rounded_rect(2, 2, ags[0].width-5, ags[0].height-4, 3, width=1, fill=get_shade(self['bg'], 0.1, 'auto-120'), 
-                tag1='_border1', tag2='_border2')
-        self.rounded_rect(2, 2, ags[0].width-4, ags[0].height-3, 4, width=2, fill='#81b3f4', tag='_tf', state='hidden')
-        self.coords('_txt', ags[0].width/2, ags[0].height/2)
-        self.coords('_img', ags[0].width/2, ags[0].height/2)
-        self.coords('_bit', ags[0].width/2, ags[0].height/2)
-        self._compound(self.cnf.get('compound'), width=ags[0].width, height=ags[0].height)
-        self.tag_raise('_txt')
-        self.tag_raise('_img')
-        self.tag_raise('_bit')
-        self.tag_raise('_tf')
-        self.after(50, self._getconfigure2)
-        # self.master.focus()
-        ## NEED TESTS:- 
-        ## if this is really needed, then change master with root 
-        ## window as this set focus to entry widget if the master is in an entry widget.
+    def _on_destroy(self, evt=None):
+        """Internal function. Forgets the button when it is destroyed."""
+        for after_id in (self._resize_id, self._pending_id):
+            if after_id is not None: self.after_cancel(after_id)
+        self._resize_id = self._pending_id = None
+        self._buttons.discard(self)
+        self._focus.buttons.discard(self)
+        self._trace_textvariable(None)
+
+    def _trace_textvariable(self, var):
+        """Internal function. Keeps a single write trace on the textvariable,
+        it is replaced if the textvariable changes."""
+        if self._textvar_trace is not None:
+            old, cbname = self._textvar_trace
+            if old is var: return
+            self._textvar_trace = None
+            try:
+                old.trace_remove('write', cbname)
+            except _TK.TclError:
+                pass
+        if var is not None:
+            self._textvar_trace = (var, var.trace_add('write', self._on_textvariable))
+
+    def _on_textvariable(self, *args):
+        """Internal function. Shows the new value of the textvariable."""
+        self.itemconfig('_txt', text=self.cnf['textvariable'].get())
+
+    def trace_counts(self):
+        """Return the number of live Tcl traces the widget has on its
+        variables. eg: `{'textvariable': 1}`."""
+        counts = {}
+        if self._textvar_trace is not None:
+            var, cbname = self._textvar_trace
+            counts['textvariable'] = sum(1 for mode, cb in var.trace_info()
+                                         if cb == cbname)
+        return counts
+
+    def _set_dimmed(self, dimmed):
+        """Internal function. Fades the edge of the button while
+        its window is not focused."""
+        if dimmed == self._dimmed: return
+        self._dimmed = dimmed
+        color = get_shade(self['bg'], 0.04 if dimmed else 0.1, 'auto-120')
+        self.itemconfig('_border1', outline=color)
+
+    def _set_size(self, evt):
+        """Internal function. This will resize everything that is in the button.
+        A burst of <Configure> events is redrawn only once when idle."""
+        if evt.width == self._size[0] and evt.height == self._size[1]: return
+        self._size = (evt.width, evt.height)
+        if self._resize_id is None:
+            self._resize_id = self.after_idle(self._resize)
+
+    def _resize(self):
+        """Internal function. Redraws the button to its latest size."""
+        self._resize_id = None
+        width, height = self._size
+        self.on_press_color(tag='_activebg', width=width, height=height,
+                            color=self.cnf.get('activebackground'))
+        shapes = ( (0, -1, width, height+3, 6),
+                   (2, 2, width-5, height-4, 3),
+                   (2, 2, width-4, height-3, 4) )
+        if self._shapes:
+            for item, xywhc in zip(self._shapes, shapes):
+                self.coords_rounded_rect(item, *xywhc)
+        else:
+            self._shapes = (
+                self.rounded_rect(*shapes[0], width=self.cnf.get('bd',6), fill=self.cnf.get('bordercolor',
+                    get_shade(self['bg'], 0.04, 'auto-120')), tag1='_bd_color1', tag2='_bd_color2'),
+                self.rounded_rect(*shapes[1], width=1, fill=get_shade(self['bg'], 0.1, 'auto-120'),
+                    tag1='_border1', tag2='_border2'),
+                self.rounded_rect(*shapes[2], width=2, fill='#81b3f4', tag='_tf', state='hidden') )
+            self.tag_raise('_txt')
+            self.tag_raise('_img')
+            self.tag_raise('_bit')
+            self.tag_raise('_tf')
+            self._getconfigure2()
+        self.coords('_txt', width/2, height/2)
+        self.coords('_img', width/2, height/2)
+        self.coords('_bit', width/2, height/2)
+        self._compound(self.cnf.get('compound'), width=width, height=height)
 
     def on_press(self, *ags):
         ''' Internal function. When button is pressed <Button-1>'''
@@ -305,7 +727,6 @@ class Widget(_Canvas):
         def on_enter(*a):
             self.itemconfig('_activebg', state='normal')
             self.itemconfig('_border1', state='hidden')
-            self.itemconfig('_border2', state='hidden')
             if self.cnf.get('repeatdelay',0) and self.cnf.get('repeatinterval', 0):
                 self._rpinloop = True
                 cmd()
@@ -314,7 +735,6 @@ class Widget(_Canvas):
         def on_leave(*a):
             self.itemconfig('_activebg', state='hidden')
             self.itemconfig('_border1', state='normal')
-            self.itemconfig('_border2', state='normal')
             if self.cnf.get('repeatdelay',0) and self.cnf.get('repeatinterval', 1):
                 self._rpinloop = False
                 self.after_cancel(self._rpin)
@@ -324,7 +744,6 @@ class Widget(_Canvas):
             self.focus_set()
             self.itemconfig('_activebg', state='normal')
             self.itemconfig('_border1', state='hidden')
-            self.itemconfig('_border2', state='hidden')
             self.bind_class('on_press_enter', '<Enter>', on_enter, '+')
             self.bind_class('on_press_leave', '<Leave>', on_leave, '+')
             if self.cnf.get('repeatdelay',0) and self.cnf.get('repeatinterval', 1):
@@ -336,7 +755,6 @@ class Widget(_Canvas):
         if self['state'] == 'normal':
             self.itemconfig('_activebg', state='hidden')
             self.itemconfig('_border1', state='normal')
-            self.itemconfig('_border2', state='normal')
             self.unbind_class('on_press_enter', '<Enter>')
             self.unbind_class('on_press_leave', '<Leave>')
             self.unbind_class('button_command', '<ButtonRelease-1>')
@@ -357,21 +775,61 @@ class Widget(_Canvas):
         Returns tuple of 2 configuration settings info, if any
         """
         kw = _TK._cnfmerge( (cnf, kw) )
+        if not kw:
+            r1 = super().configure()
+            if r1 is not None:
+                r1.update(self.cnf)
+            return r1
         cnf = {}
         for i in list(kw):
             if i in self._features: 
                 cnf[i] = kw.pop(i,None)
-        r1 = super().configure(**kw)
+        if kw:
+            super().configure(**kw)
         if kw.get('bg') or kw.get('background'):
             self.original_bg = self['bg']
-        self.after(10, self._getconfigure2, cnf)
-        if r1 is not None:
-            r1.update(self.cnf)
-        return r1
+        # Changes are collected and applied together when idle.
+        self._pending_cnf.update(cnf)
+        if not self._batch_depth and self._pending_id is None:
+            self._pending_id = self.after_idle(self._flush_configure)
     config = configure
 
+    def configure_many(self, cnf=None, **kw):
+        """Configure many resources of a widget at once.
+
+        Same as `configure` but all the changes are applied
+        together right away instead of when idle."""
+        with self.batch():
+            self.configure(cnf, **kw)
+
+    @contextmanager
+    def batch(self):
+        """Apply all the changes made with `configure` inside the
+        `with` block together in one pass when the block ends.
+
+        ### Example:
+            with button.batch():
+                button['text'] = 'Stop'
+                button.configure(bg='red', fg='white', state='normal')
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth: self._flush_configure()
+
+    def _flush_configure(self):
+        """Internal function. Applies the pending changes of `configure`."""
+        if self._pending_id is not None:
+            self.after_cancel(self._pending_id)
+            self._pending_id = None
+        cnf, self._pending_cnf = self._pending_cnf, {}
+        self._getconfigure2(cnf)
+
     def cget(self, key):
         """Return the resource value for a KEY given as string."""
+        if key in self._pending_cnf: return self._pending_cnf[key]
         if key in self._features: return self.cnf[key]
         else: return super().cget(key)
     __getitem__ = cget
@@ -467,8 +925,7 @@ class Widget(_Canvas):
         
         if self.cnf.get('textvariable') is not None:
             self.cnf['text'] = self.cnf['textvariable'].get()
-            self.cnf['textvariable'].trace_add( 'write', lambda *ag: 
-                    self.itemconfig('_txt', text = self.cnf['textvariable'].get() ))
+        self._trace_textvariable(self.cnf.get('textvariable'))
 
         # For Text config
         config_cnf_txt = {}
@@ -491,14 +948,14 @@ class Widget(_Canvas):
     
         Edge_color = get_shade(self['bg'], 0.1, 'auto-120')    # This will darken the border around the button
         self.itemconfig('_border1', outline=Edge_color)
-        self.itemconfig('_border2', fill=Edge_color)
+        self._dimmed = False
 
         if kw.get('bd'):
             self.itemconfig('_bd_color1', width=kw.get('bd', 6))
-            self.itemconfig('_bd_color2', width=kw.get('bd', 6))
 
         if bool(kw.get('borderless')): 
             # Modify configurations of master widget to support `borderless=1`.
+            master, buttons = self.master, self._buttons
             def configure(cnf=None, **kw):
                 """Configure resources of a widget.
 
@@ -508,27 +965,27 @@ class Widget(_Canvas):
                 """
                 #  Need a better fix ..
                 kw = _TK._cnfmerge((cnf, kw))
-                r = self.master._configure('configure', None, kw)
+                r = master._configure('configure', None, kw)
                 if kw.get('bg') or kw.get('background'):
-                    for i in self._buttons:
+                    for i in buttons.children(master):
                         if i['borderless']:
-                            i.cnf.update( {'bordercolor': i.master['bg']} )
-                            i.itemconfig('_bd_color1', outline=i.master['bg'])
-                            i.itemconfig('_bd_color2', fill=i.master['bg'])
+                            i.cnf.update( {'bordercolor': master['bg']} )
+                            i.itemconfig('_bd_color1', outline=master['bg'])
                 return r
 
-            self.master.configure = configure
-            self.master.config = configure
+            if not getattr(master.configure, '_borderless', False):
+                configure._borderless = True
+                master.configure = configure
+                master.config = configure
             self.cnf.update( {'bordercolor': self.master['bg']} )
             self.itemconfig('_bd_color1', outline=self.master['bg'])
-            self.itemconfig('_bd_color2', fill=self.master['bg'])
         elif not bool(kw.get('borderless', True)) or not self.cnf.get('borderless'):
             if self.cnf.get('bordercolor') == self.master['bg']:
                 self.cnf.pop('bordercolor', None)
             bd_color = self.cnf.get('bordercolor', get_shade(self['bg'], 0.04, 'auto-120'))
             self.cnf.update( {'bordercolor': bd_color} )
             self.itemconfig('_bd_color1', outline=kw.get('bordercolor', bd_color) )
-            self.itemconfig('_bd_color2', fill=kw.get('bordercolor', bd_color) )
+        self._set_dimmed(self._focus.active is False)
     
     def bind_class(self, className, sequence=None, func=None, add='+'):
         className = className+str(self)
@@ -554,12 +1011,6 @@ class Widget(_Canvas):
         3. `height`
         4. `width`'''
         self.cnf['activebackground'] = self.cnf.get('activebackground', ("#4b91fe", "#055be5"))
-        width = self.coords('_activebg')
-        if len(width) > 3:
-            width = width[2]
-        if self.winfo_height() == len(self.find('withtag', '_activebg')) \
-            and self.winfo_width() == width and not kw.get('color'): return
-        self.delete('_activebg')
         tag = kw.get('tag', 'press')
         if kw.get('color') is None: kw.pop('color', None)
         cr = kw.get( 'color', ("#4b91fe", "#055be5") )  # This is the default color for mac 
@@ -568,30 +1019,82 @@ class Widget(_Canvas):
                 cr = list(cr)
                 cr.remove(None)
                 cr = cr[0]
-        w, h = self.winfo_width(), self.winfo_height()
-        if not isinstance(cr, tuple): cr = ( C.Color(cr),C.Color(cr) )
-        else: cr = ( C.Color(cr[0]),C.Color(cr[1]) )
-        for i, j in enumerate(list( cr[0].range_to( cr[1],  kw.get('heigh', h)) )):
-            self._line(0, i, kw.get('width',w), i, fill=j, tag=tag, state='hidden')
+        if not isinstance(cr, tuple): cr = (cr, cr)
+        image = _gradient(self, cr[0], cr[1], kw.get('width', self.winfo_width()), 
+                          kw.get('height', self.winfo_height()))
+        if not self.find('withtag', tag):
+            self._image(0, 0, anchor='nw', tag=tag, state='hidden')
+        if image is not getattr(self, '_activebg_image', None):
+            # Keep a reference, the cache may let go of the image.
+            self._activebg_image = image
+            self.itemconfig(tag, image=image)
         self.tag_lower(tag)     # keep the tag last 
         return tag 
 
+    def _button_chrome(self):
+        """Internal Function.\n
+        Returns the space a ttk button with no padding takes around
+        its content, the default font and the minimum width in characters.
+        It is measured once per interpreter with a single ttk button."""
+        chrome = _button_chrome_cache.get(self.tk)
+        if chrome is None:
+            style = ttk.Style(self)
+            style.configure('tkmacosx_sizing.TButton', padding=(0, 0))
+            font = style.lookup('TButton', 'font') or 'TkDefaultFont'
+            minchars = int(str(style.lookup('TButton', 'width') or 0))
+            text = '0'*20
+            text_w, text_h = self._text_size(font, text)
+            tmp = ttk.Button(self, text=text, style='tkmacosx_sizing.TButton')
+            chrome = (tmp.winfo_reqwidth() - text_w, tmp.winfo_reqheight() - text_h,
+                      font, minchars)
+            tmp.destroy()
+            _button_chrome_cache[self.tk] = chrome
+        return chrome
+
+    def _text_size(self, font, text):
+        "Internal Function. Returns width and height of (multiline) `text` in `font`."
+        lines = str(text).split('\n')
+        width = max(self.tk.getint(self.tk.call('font', 'measure', font, line))
+                    for line in lines)
+        linespace = self.tk.getint(self.tk.call('font', 'metrics', font, '-linespace'))
+        return width, linespace*len(lines)
+
     def _info_button(self, **kw):
         """Internal Funtion.\n
         This function takes essentials parameters to give
         the approximate width and height accordingly. \n
-        It creates a ttk button and use all the resouces given 
-        and returns width and height of the ttk button, after taking 
-        width and height the button gets destroyed also the custom style."""
-        _style_tmp = ttk.Style()
-        _style_tmp.configure('%s.TButton'%self, font=kw.get('font') ) 
-        _style_tmp.configure('%s.TButton'%self, padding=kw.get('padding') )
-        tmp = ttk.Button(self, text=kw.get('text'), image=kw.get('image'), 
-            bitmap=kw.get('bitmap'), textvariable=kw.get('textvariable'),
-            compound=kw.get('compound'), style='%s.TButton'%self )
-        geo = tmp.winfo_reqwidth(), tmp.winfo_reqheight()
-        del _style_tmp   # Need fix --- doesn't really delete the custom style
-        tmp.destroy()
+        The size is calculated from the font metrics of the text and the
+        size of the image the same way a ttk button lays them out, and
+        memoized by (text, font, padding, compound, image size)."""
+        chrome_w, chrome_h, default_font, minchars = self._button_chrome()
+        text = kw['textvariable'].get() if kw.get('textvariable') is not None \
+                else kw.get('text')
+        text = '' if text is None else str(text)
+        font = kw.get('font') or default_font
+        image = kw.get('image')
+        image_size = None
+        if image:
+            image_size = ( self.tk.getint(self.tk.call('image', 'width', image)),
+                           self.tk.getint(self.tk.call('image', 'height', image)) )
+        padx, pady = ( self.winfo_pixels(p) if isinstance(p, str) else p
+                        for p in kw.get('padding') or (0, 0) )
+        compound = kw.get('compound')
+        key = (self.tk, text, str(font), (padx, pady), compound, image_size)
+        geo = _size_cache.get(key)
+        if geo is not None: return geo
+
+        W, H = self._text_size(font, text)
+        if minchars < 0:
+            W = max(W, -minchars * self._text_size(font, '0')[0])
+        if image_size and compound in (None, 'none', 'image'):
+            W, H = image_size
+        elif image_size and compound in ('top', 'bottom'):
+            W, H = max(W, image_size[0]), H + image_size[1] + 4
+        elif image_size and compound in ('left', 'right'):
+            W, H = W + image_size[0] + 4, max(H, image_size[1])
+        elif image_size and compound == 'center':
+            W, H = max(W, image_size[0]), max(H, image_size[1])
+        geo = _size_cache[key] = (W + chrome_w + 2*padx, H + chrome_h + 2*pady)
         return geo
 
     def _compound(self, flag, height, width):
@@ -19,14 +19,59 @@ Version: 0.1.0
 '''
 
 import tkinter as tk
-from tkmacosx.basewidget import _Canvas
+from tkmacosx.basewidget import _Canvas, _LRUCache
 from PIL import Image, ImageTk
 from tkinter.font import Font
 from tkinter import font
 import numpy as np
+import time
 import os
 
 
+_asset = None
+# (orient, width, height)  ---->  PIL image
+_render_cache = _LRUCache(32)
+# (tk, orient, width, height)  ---->  PhotoImage
+_photo_cache = _LRUCache(32)
+# tk  ---->  Font of the info text
+_info_fonts = {}
+
+
+def _colorscale_asset():
+    """Internal function. Returns the colorscale array, loaded once and
+    memory-mapped read-only."""
+    global _asset
+    if _asset is None:
+        _asset = np.load(os.path.join(os.path.dirname(os.path.abspath(
+            __file__)), 'images', 'colorscale.npy'), mmap_mode='r')
+    return _asset
+
+
+def _render(orient, width, height):
+    """Internal function. Returns the colorscale rotated for `orient` and
+    resized to `width` and `height`. Renders are shared."""
+    orient = 'vertical' if 'ver' in orient else 'horizontal'
+    key = (orient, width, height)
+    im = _render_cache.get(key)
+    if im is None:
+        im = _render_cache[key] = Image.fromarray(
+            np.asarray(_colorscale_asset())).rotate(0 if orient == 'vertical'
+            else 270, expand=1).resize((width, height))
+    return im
+
+
+def _photo(master, orient, width, height):
+    """Internal function. Returns the PhotoImage of `_render`, shared by
+    the colorscales of the same interpreter, orient and size."""
+    orient = 'vertical' if 'ver' in orient else 'horizontal'
+    key = (master.tk, orient, width, height)
+    photo = _photo_cache.get(key)
+    if photo is None:
+        photo = _photo_cache[key] = ImageTk.PhotoImage(
+            _render(orient, width, height), master=master)
+    return photo
+
+
 class Colorscale(_Canvas):
     """
     ## Color Scale.
@@ -59,9 +104,13 @@ class Colorscale(_Canvas):
         tk.Canvas.__init__(self, master=master, **kw)
         self.xy_axis = int(self.winfo_width()/3)
         self._size = (0,0)
+        self._new_size = (0,0)
+        self._resize_id = None
+        self._remove_id = None
+        self._remove_at = 0
+        self._marker_color = None
 
-        self.np_im = np.load(os.path.dirname
-                (os.path.abspath(__file__))+"/images/colorscale.npy")
+        self.np_im = _colorscale_asset()
         self.image_id = self._image(0, 0, anchor='nw')
 
         # Binds
@@ -74,8 +123,8 @@ class Colorscale(_Canvas):
         '''Intenal function. Sets mousewheel scrolling.'''
         def on_mousewheel(evt=None):
             "Internal function."
-            if evt.delta <= -1 and bool(self.xy_axis < self.winfo_width() \
-                or self.xy_axis < self.winfo_height()):
+            if evt.delta <= -1 and bool(self.xy_axis < self._size[0] \
+                or self.xy_axis < self._size[1]):
                 self.xy_axis += 1
                 self.move_marker(evt, mw=self.xy_axis)
             if evt.delta >= 1 and self.xy_axis > 1:
@@ -87,28 +136,45 @@ class Colorscale(_Canvas):
         else: self.unbind("<MouseWheel>")
 
     def on_resize(self, evt):
+        '''Internal function. Redraws on idle, once for many events.'''
+        self._new_size = (evt.width, evt.height)
+        if self._resize_id is None:
+            self._resize_id = self.after_idle(self._resize)
+
+    def _resize(self):
         '''Internal function.'''
-        if evt.width == self._size[0] and evt.height == self._size[1]: return
-        self._size = (evt.width, evt.height)
-        self._im = Image.fromarray(self.np_im).rotate(0 if 'ver' in
-                            self.cnf['orient'] else 270, expand=1).resize(
-                            (evt.width, evt.height))
-        self.pixels = self._im.load()
-        self._im = ImageTk.PhotoImage(self._im)
+        self._resize_id = None
+        width, height = self._new_size
+        if (width, height) == self._size: return
+        self._size = (width, height)
+        self.pixels = _render(self.cnf['orient'], width, height).load()
+        self._im = _photo(self, self.cnf['orient'], width, height)
         self.itemconfig(self.image_id, image=self._im)
-        
-        self.delete('marker')
-        self.delete('borderline1')
-        self.delete('borderline2')
-        self.rounded_rect(1, 1, evt.width-2, evt.height-2, 1, width=2, 
-            fill='#81b3f4', tag1='borderline1', tag2='borderline2')
-        self.rounded_rect(
-            evt.width/3 if 'ver' in self.cnf['orient'] else 2,
-            2 if 'ver' in self.cnf['orient'] else evt.height/3,
-            5 if 'ver' in self.cnf['orient'] else evt.width-4,
-            evt.height-4 if 'ver' in self.cnf['orient'] else 5,
-            2, width=2, fill="black", tag="marker")
-        
+
+        marker = (width/3 if 'ver' in self.cnf['orient'] else 2,
+                  2 if 'ver' in self.cnf['orient'] else height/3,
+                  5 if 'ver' in self.cnf['orient'] else width-4,
+                  height-4 if 'ver' in self.cnf['orient'] else 5, 2)
+        if getattr(self, '_border_id', None) is None:
+            self._border_id = self.rounded_rect(1, 1, width-2, height-2, 1,
+                width=2, fill='#81b3f4', tag1='borderline1', tag2='borderline2')
+            self._marker_id = self.rounded_rect(*marker, width=2,
+                fill="black", tag="marker")
+            self._markerbg_id = self._rounded(0, 0, 1, 1, 6, fill='black',
+                state='hidden', tag=('markerbg', 'showinfo'))
+            self._info_id = self._text(0, 0, text='', state='hidden',
+                font=self._info_font(), tag=('info', 'showinfo'))
+        else:
+            self.coords_rounded_rect(self._border_id, 1, 1, width-2, height-2, 1)
+            self.coords_rounded_rect(self._marker_id, *marker)
+
+    def _info_font(self):
+        '''Internal function. Font of the info text, one per interpreter.'''
+        font = _info_fonts.get(self.tk)
+        if font is None:
+            font = _info_fonts[self.tk] = Font(root=self, size=10)
+        return font
+
     def configure(self, cnf={}, **kw):
         """Configure resources of a widget.
 
@@ -136,8 +202,12 @@ class Colorscale(_Canvas):
 
     def Release(self, evt=None):
         "Internal function."
-        self.delete("info")
-        self.delete("markerbg")
+        self._remove_id = None
+        delay = int((self._remove_at - time.perf_counter())*1000)
+        if delay > 0:
+            self._remove_id = self.after(delay, self.Release)
+        else:
+            self.itemconfig('showinfo', state='hidden')
 
     def RGB2HEX(self, R, G, B):
         "Internal function. Use to convert RGB to HEX"
@@ -145,23 +215,26 @@ class Colorscale(_Canvas):
 
     def move_marker(self, evt, mw=None):
         "Internal function."
+        vertical = 'ver' in self.cnf['orient']
+        width, height = self._size
         if mw:
-            evt.x = mw if 'ver' in self.cnf['orient'] else 10
-            evt.y = 10 if 'ver' in self.cnf['orient'] else mw
+            evt.x = mw if vertical else 10
+            evt.y = 10 if vertical else mw
 
-        self.after_cancel(getattr(self, '_remove_id', ' '))
-        self._remove_id = self.after(self.cnf['showinfodelay'], self.Release)
+        # Hide the info `showinfodelay` ms after the last event.
+        self._remove_at = time.perf_counter() + self.cnf['showinfodelay']/1000.0
+        if self._remove_id is None:
+            self._remove_id = self.after(self.cnf['showinfodelay'], self.Release)
 
-        if (evt.x > 0 and evt.y > 0 and evt.x < self.winfo_width() and evt.y < self.winfo_height()):
+        if (evt.x > 0 and evt.y > 0 and evt.x < width and evt.y < height):
             if not mw:
                 self.xy_axis = evt.x
             RGB = self.pixels[evt.x, evt.y][:-1]
             hexcode = self.RGB2HEX(RGB[0], RGB[1], RGB[2])
             maker_color = 'black' if (
                 RGB[0]*0.299 + RGB[1]*0.587 + RGB[2]*0.114) > 110 else 'white'
-            
-            self.itemconfig('borderline1', outline=hexcode)
-            self.itemconfig('borderline2', fill=hexcode)
+
+            self.itemconfig(self._border_id, outline=hexcode)
 
             if self.cnf['value'] == "rgb":
                 spacer = 50
@@ -174,40 +247,31 @@ class Colorscale(_Canvas):
                 text = hexcode
                 self.callback(hexcode)
 
-            self.delete("marker")
-            self.Release()
-
-            self.rounded_rect(
-                evt.x if 'ver' in self.cnf['orient'] else 2,
-                2 if 'ver' in self.cnf['orient'] else evt.y,
-                5 if 'ver' in self.cnf['orient'] else self.winfo_width()-4,
-                self.winfo_height()-4 if 'ver' in self.cnf['orient'] else 5,
-                2, width=2, fill=maker_color, tag="marker")
-
-            if bool(evt.x < self.winfo_width()-100 or evt.y < self.winfo_height()-100) and self['showinfo']:
-                self._rounded(
-                    evt.x+spacer-spacbg if 'ver' in self.cnf['orient'] else self.winfo_width()/2-6,
-                    self.winfo_height()/2-6 if 'ver' in self.cnf['orient'] else evt.y+spacer-spacbg,
-                    evt.x+spacer+spacbg if 'ver' in self.cnf['orient'] else self.winfo_width()/2+7,
-                    self.winfo_height()/2+7 if 'ver' in self.cnf['orient'] else evt.y+spacer+spacbg,
-                    6, fill=maker_color, tag="markerbg")
-                self._text(
-                    evt.x+spacer if 'ver' in self.cnf['orient'] else self.winfo_width()/2,
-                    self.winfo_height()/2 if 'ver' in self.cnf['orient'] else evt.y+spacer,
-                    angle=0 if 'ver' in self.cnf['orient'] else 90,
-                    text=text, font=Font(size=10), tag="info", fill=hexcode)
-            elif self['showinfo']:
-                self._rounded(
-                    evt.x-spacer-spacbg if 'ver' in self.cnf['orient'] else self.winfo_width()/2-6,
-                    self.winfo_height()/2-6 if 'ver' in self.cnf['orient'] else evt.y-spacer-spacbg,
-                    evt.x-spacer+spacbg if 'ver' in self.cnf['orient'] else self.winfo_width()/2+7,
-                    self.winfo_height()/2+7 if 'ver' in self.cnf['orient'] else evt.y-spacer+spacbg,
-                    6, fill=maker_color, tag="markerbg")
-                self._text(
-                    evt.x-spacer if 'ver' in self.cnf['orient'] else self.winfo_width()/2,
-                    self.winfo_height()/2 if 'ver' in self.cnf['orient'] else evt.y-spacer,
-                    angle=0 if 'ver' in self.cnf['orient'] else 90,
-                    text=text, font=Font(size=10), tag="info", fill=hexcode)
+            self.coords_rounded_rect(self._marker_id,
+                evt.x if vertical else 2,
+                2 if vertical else evt.y,
+                5 if vertical else width-4,
+                height-4 if vertical else 5, 2)
+            if maker_color != self._marker_color:
+                self._marker_color = maker_color
+                self.itemconfig(self._marker_id, outline=maker_color)
+
+            if not self['showinfo']:
+                return
+            if not bool(evt.x < width-100 or evt.y < height-100):
+                spacer = -spacer
+            x1, y1, x2, y2 = (
+                evt.x+spacer-spacbg if vertical else width/2-6,
+                height/2-6 if vertical else evt.y+spacer-spacbg,
+                evt.x+spacer+spacbg if vertical else width/2+7,
+                height/2+7 if vertical else evt.y+spacer+spacbg)
+            self.coords_rounded_rect(self._markerbg_id, x1, y1, x2-x1, y2-y1, 3)
+            self.itemconfig(self._markerbg_id, fill=maker_color, state='normal')
+            self.coords(self._info_id,
+                evt.x+spacer if vertical else width/2,
+                height/2 if vertical else evt.y+spacer)
+            self.itemconfig(self._info_id, text=text, fill=hexcode,
+                angle=0 if vertical else 90, state='normal')
 
     def callback(self, val):
         "Internal function."
@@ -234,5 +298,6 @@ def demo_colorscale():
     root.mainloop()
     return "break"
 
+
 if __name__ == "__main__":
     demo_colorscale()
\ No newline at end of file
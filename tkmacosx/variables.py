@@ -12,53 +12,356 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import os
 import re
 import ast
+import atexit
 import pickle as pkl
+try:
+    import fcntl
+except ImportError:     # Windows
+    fcntl = None
+import time
+import weakref
+from contextlib import contextmanager
 import tkinter as _TK
 import tkmacosx
+import numpy as np
+from tkmacosx.basewidget import _get_rgb, _hex_digits, _rgb_to_hsl, _hsl_to_rgb
 
 
+class _ColorVarFanout:
+    """Internal class. Applies the value of a variable to all the widgets
+    and canvas items using it as a color.
+
+    A single trace is added to the variable. Successive writes are coalesced
+    into one flush on idle, which reads the value once and applies it to
+    all the subscribers in one Tcl script. Widgets with a Python `configure`
+    (like tkmacosx widgets) are configured through it instead."""
+
+    def __init__(self, var):
+        self.var = var
+        self.subscribers = weakref.WeakKeyDictionary()  # widget -> {key}
+        self._after_id = None
+        self._cbname = var.trace_add('write', self._on_write)
+
+    @classmethod
+    def of(cls, var):
+        """Return the fan-out of `var`, create it if needed."""
+        fanout = getattr(var, '_colorvar_fanout', None)
+        if fanout is None:
+            fanout = var._colorvar_fanout = cls(var)
+        return fanout
+
+    def subscribe(self, widget, key):
+        """Apply the value to `key` of `widget` on every write. `key` is an
+        option name or a tuple of (option, canvas item id)."""
+        self.subscribers.setdefault(widget, set()).add(key)
+
+    def unsubscribe(self, widget, key):
+        """Stop applying the value to `key` of `widget`. The trace is
+        removed when no subscribers are left."""
+        keys = self.subscribers.get(widget)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self.subscribers[widget]
+        if not self.subscribers:
+            self.close()
+
+    def close(self):
+        """Remove the trace and cancel the pending flush."""
+        if self._after_id is not None:
+            self.var._root.after_cancel(self._after_id)
+            self._after_id = None
+        try:
+            self.var.trace_remove('write', self._cbname)
+        except _TK.TclError:
+            pass
+        if getattr(self.var, '_colorvar_fanout', None) is self:
+            del self.var._colorvar_fanout
+
+    def _on_write(self, *args):
+        "Internal function."
+        if self._after_id is None:
+            self._after_id = self.var._root.after_idle(self.flush)
+
+    def flush(self):
+        """Apply the current value to all the subscribers now."""
+        if self._after_id is not None:
+            self.var._root.after_cancel(self._after_id)
+            self._after_id = None
+        value = self.var.get()
+        script, python = [], []
+        for widget, keys in list(self.subscribers.items()):
+            opts, items = {}, {}
+            for key in keys:
+                if isinstance(key, tuple):
+                    items.setdefault(key[1], {})[key[0]] = value
+                else:
+                    opts[key] = value
+            if opts:
+                if getattr(widget.config, '__func__', None) is _TK.Misc.configure:
+                    script.append(_TK._join(
+                        (widget._w, 'configure') + _flatten_opts(opts)))
+                else:
+                    python.append((widget, opts))
+            for tagId, cnf in items.items():
+                script.append(_TK._join(
+                    (widget._w, 'itemconfigure', tagId) + _flatten_opts(cnf)))
+        # A failing subscriber must not stop the others, the first error
+        # is raised once all of them are done.
+        error = None
+        if script:
+            try:
+                self.var._tk.eval('\n'.join(script))
+            except _TK.TclError:
+                for cmd in script:
+                    try:
+                        self.var._tk.eval(cmd)
+                    except _TK.TclError as e:
+                        error = error or e
+        for widget, opts in python:
+            try:
+                widget.config(opts)
+            except _TK.TclError as e:
+                error = error or e
+        if error is not None:
+            raise error
+
+
+def _flatten_opts(cnf):
+    "Internal function."
+    return tuple(x for k, v in cnf.items() for x in ('-'+k, v))
+
+
+class _TraceRegistry:
+    """Internal class. Keeps the ColorVar subscriptions of widgets and
+    canvas items.
+
+    Widgets are weakly referenced. When a widget is destroyed or a canvas
+    item is deleted, its entries are removed and unsubscribed."""
+
+    def __init__(self):
+        self._widgets = weakref.WeakKeyDictionary()  # widget -> {key: var}
+
+    def add(self, widget, key, var):
+        """Subscribe `key` of `widget` to `var`. The subscription replaced
+        by it is removed."""
+        traces = self._widgets.get(widget)
+        if traces is None:
+            traces = self._widgets[widget] = {}
+            self._hook_destroy(widget)
+        old = traces.get(key)
+        if old is not None:
+            self._remove_trace(widget, key, *old)
+        _ColorVarFanout.of(var).subscribe(widget, key)
+        traces[key] = var
+
+    def pop(self, widget, key):
+        """Remove the entry of `key` of `widget` without unsubscribing it."""
+        traces = self._widgets.get(widget)
+        if traces is not None:
+            return traces.pop(key, None)
+
+    def remove(self, widget):
+        """Remove all the entries of `widget`."""
+        for key, var in self._widgets.pop(widget, {}).items():
+            self._remove_trace(widget, key, var)
+
+    def remove_items(self, canvas, items):
+        """Remove the entries of the canvas `items`."""
+        traces = self._widgets.get(canvas)
+        if not traces: return
+        for key in [k for k in traces if isinstance(k, tuple) and k[1] in items]:
+            self._remove_trace(canvas, key, traces.pop(key))
+
+    def entries(self, widget):
+        """Return a dict of the entries of `widget`."""
+        return dict(self._widgets.get(widget, {}))
+
+    def __contains__(self, widget):
+        return bool(self._widgets.get(widget))
+
+    def counts(self):
+        """Return the number of subscriptions of every widget."""
+        return { str(w): len(t) for w, t in list(self._widgets.items()) if t }
+
+    def _remove_trace(self, widget, key, var):
+        "Internal function."
+        fanout = getattr(var, '_colorvar_fanout', None)
+        if fanout is not None:
+            fanout.unsubscribe(widget, key)
+
+    def _hook_destroy(self, widget):
+        """Internal function. Removes the entries of `widget` on <Destroy>.
+
+        Options are converted before the Tk widget is created, so the
+        bindtag is added on idle if the window does not exist yet."""
+        tag = '_colorvar%s' % widget
+        def on_destroy():
+            widget.tk.call('bind', tag, '<Destroy>', '')
+            self.remove(widget)
+        def add_bindtag():
+            try:
+                widget.bindtags((tag,) + widget.bindtags())
+            except _TK.TclError:    # Destroyed before idle.
+                self.remove(widget)
+        widget.tk.call('bind', tag, '<Destroy>', widget._register(on_destroy))
+        if widget.winfo_exists():
+            add_bindtag()
+        else:
+            widget.after_idle(add_bindtag)
+
+
+# Stock tkinter functions replaced below.
+_stock_options = _TK.Misc._options
+_stock_configure = _TK.Misc._configure
+_stock_create = _TK.Canvas._create
+_Variable = _TK.Variable    # Looked up on every _options call.
+
+# Options of widgets and canvas items which can take a ColorVar.
+_WIDGET_COLOR_KEYS = frozenset((
+    'fg', 'foreground', 'bg', 'background',
+    'activebackground', 'activeforeground', 'disabledforeground',
+    'highlightbackground', 'highlightcolor', 'selectforeground',
+    'readonlybackground', 'selectbackground', 'insertbackground',
+    'disabledbackground', 'fill'))
+_ITEM_COLOR_KEYS = frozenset((
+    'activefill', 'activeoutline', 'disabledfill',
+    'disabledoutline', 'fill', 'outline', 'background',
+    'activebackground', 'activeforeground',
+    'disabledbackground', 'disabledforeground',
+    'foreground'))
+
 # Modified Misc._options(...) to make ColorVar work with tkinter
-_all_traces_colorvar = {}
+_colorvar_traces = _TraceRegistry()
+_colorvar_scope = {'enabled': True, 'installed': False,
+                   'classes': (), 'masters': weakref.WeakSet()}
+
+
+def _install_patches():
+    """Internal function. Replace the tkinter functions to handle ColorVar.
+    Done when the first ColorVar is made or by `enable_colorvar`, so the
+    programs which don't use ColorVar run the stock tkinter code."""
+    if _colorvar_scope['installed']: return
+    _colorvar_scope['installed'] = True
+    _TK.Misc._options = _options
+    _TK.Canvas._create = _create
+    _TK.Misc._configure = _configure
+    _TK.Canvas.delete = _delete
+
+
+def _remove_patches():
+    """Internal function. Put the stock tkinter functions back. The patched
+    `Canvas.delete` is kept to forget the ColorVar of deleted items."""
+    if not _colorvar_scope['installed']: return
+    _colorvar_scope['installed'] = False
+    _TK.Misc._options = _stock_options
+    _TK.Canvas._create = _stock_create
+    _TK.Misc._configure = _stock_configure
+
+
+def enable_colorvar(classes=(), masters=()):
+    """Handle ColorVar given to widget and canvas item options.
+
+    It is enabled for all widgets as soon as a ColorVar is made. Call it
+    to handle other `tkinter.Variable` as colors before any ColorVar
+    exists. If `classes` or `masters` are given, only instances of
+    `classes` and widgets inside `masters` are handled, others use the
+    stock tkinter code."""
+    _colorvar_scope['enabled'] = True
+    _colorvar_scope['classes'] = tuple(classes)
+    _colorvar_scope['masters'] = weakref.WeakSet(masters)
+    _install_patches()
+
+
+def disable_colorvar():
+    """Stop handling ColorVar given to options. Options go through the
+    stock tkinter code."""
+    _colorvar_scope['enabled'] = False
+    _remove_patches()
+
+
+@contextmanager
+def colorvar_scope(classes=(), masters=()):
+    """Context manager. Handle ColorVar only for `classes` and widgets
+    inside `masters` in the block, the previous state is restored after.
+
+    ### Example:
+        with colorvar_scope(masters=[frame]):
+            tk.Label(frame, bg=color).pack()"""
+    old = dict(_colorvar_scope)
+    enable_colorvar(classes, masters)
+    try:
+        yield
+    finally:
+        old['installed'] = _colorvar_scope['installed']
+        _colorvar_scope.update(old)
+        if not old['enabled']:
+            _remove_patches()
+
+
+def _colorvar_applies(widget):
+    "Internal function. Return True if ColorVar is handled for `widget`."
+    scope = _colorvar_scope
+    if not scope['enabled']:
+        return False
+    if not (scope['classes'] or scope['masters']):
+        return True
+    if scope['classes'] and isinstance(widget, scope['classes']):
+        return True
+    masters = scope['masters']
+    while widget is not None:
+        if widget in masters:
+            return True
+        widget = getattr(widget, 'master', None)
+    return False
+
+
+def _colorvars(widget, cnf, keys):
+    """Internal function. Return a list of (option, Variable) of `cnf`
+    which are handled as ColorVar for `widget`."""
+    found = [(i, cnf[i]) for i in keys if isinstance(cnf[i], _TK.Variable)]
+    if found and _colorvar_applies(widget):
+        return found
+    return ()
+
+
+def colorvar_trace_counts():
+    """Return the number of live ColorVar subscriptions of every widget as
+    `{widget path: count}`. Useful to monitor leaks."""
+    return _colorvar_traces.counts()
+
+
+def _delete(self, *args):
+    """Delete items identified by all tag or ids contained in ARGS."""
+    if self in _colorvar_traces:
+        items = set()
+        for tagOrId in args:
+            items.update(self.find_withtag(tagOrId))
+        _colorvar_traces.remove_items(self, items)
+    self.tk.call((self._w, 'delete') + args)
 
 
 def _configure(self, cmd, cnf, kw):
     """Internal function."""
-    if kw:
-        cnf = _TK._cnfmerge((cnf, kw))
-    elif cnf:
-        cnf = _TK._cnfmerge(cnf)
-    if cnf is None:
-        return self._getconfigure(_TK._flatten((self._w, cmd)))
-    if isinstance(cnf, str):
-        return self._getconfigure1(_TK._flatten((self._w, cmd, '-'+cnf)))
-
     # -------------------- Added the below block --------------------
     # Add the resources to the list to have ColorVar functionality.
-    if isinstance(cmd, tuple) and isinstance(self, _TK.Canvas):
-        tags = self.find_withtag(cmd[1])
-        cnf_copy = cnf.copy()
-        for tag in tags:
-            for i in ('activefill', 'activeoutline', 'disabledfill',
-                      'disabledoutline', 'fill', 'outline', 'background',
-                      'activebackground', 'activeforeground',
-                      'disabledbackground', 'disabledforeground',
-                      'foreground'):
-                if isinstance(cnf_copy.get(i), _TK.Variable):
-                    var = cnf_copy[i]
-                    cbname = var.trace_add('write', lambda *a,
-                                           cls=self, opt=i,
-                                           tagId=tag, var=var:
-                                           cls.itemconfig(tagId, {opt: var.get()}))
-                    if (self, (i, tag)) in _all_traces_colorvar:
-                        v, cb = _all_traces_colorvar.get((self, (i, tag)))
-                        v.trace_remove('write', cb)
-                        _all_traces_colorvar[(self, (i, tag))] = (var, cbname)
-                    else:
-                        _all_traces_colorvar[(self, (i, tag))] = (var, cbname)
+    if isinstance(cmd, tuple) and isinstance(self, _TK.Canvas) and (cnf or kw):
+        cnf = _TK._cnfmerge((cnf, kw)) if kw else _TK._cnfmerge(cnf)
+        kw = None
+        if isinstance(cnf, dict):
+            keys = _ITEM_COLOR_KEYS.intersection(cnf)
+            found = keys and _colorvars(self, cnf, keys)
+            if found:
+                tags = self.find_withtag(cmd[1])
+                for i, var in found:
+                    for tag in tags:
+                        _colorvar_traces.add(self, (i, tag), var)
                     cnf[i] = var.get()
-    self.tk.call(_TK._flatten((self._w, cmd)) + self._options(cnf))
+    # ---------------------------------------------------------------
+    return _stock_configure(self, cmd, cnf, kw)
 
 
 def _create(self, itemType, args, kw):  # Args: (val, val, ..., cnf={})
@@ -72,16 +375,13 @@ def _create(self, itemType, args, kw):  # Args: (val, val, ..., cnf={})
 
     # -------------------- Added the below block --------------------
     # Add the resources to the list to have ColorVar functionality.
-    ckw = _TK._cnfmerge((cnf, kw))
-    var = None
-    for i in ('activefill', 'activeoutline', 'disabledfill',
-              'disabledoutline', 'fill', 'outline', 'background',
-              'activebackground', 'activeforeground',
-              'disabledbackground', 'disabledforeground',
-              'foreground'):
-        if isinstance(ckw.get(i), _TK.Variable):
-            var = ckw[i]
-            _all_traces_colorvar[(self, (i, None))] = (var, None)
+    pending = ()
+    if cnf or kw:
+        ckw = _TK._cnfmerge((cnf, kw)) if cnf else kw
+        keys = _ITEM_COLOR_KEYS.intersection(ckw)
+        if keys:
+            pending = _colorvars(self, ckw, keys)
+        for i, var in pending:
             if i in cnf:
                 cnf[i] = var.get()
             elif i in kw:
@@ -92,53 +392,20 @@ def _create(self, itemType, args, kw):  # Args: (val, val, ..., cnf={})
         self._w, 'create', itemType,
         *(args + self._options(cnf, kw))))
 
-    for key, value in _all_traces_colorvar.copy().items():
-        wid, (opt, tag_id) = key
-        var, cbname = value
-        if tag_id is None and cbname is None:
-            cbname = var.trace_add('write', lambda *a,
-                                   cls=self, opt=opt,
-                                   tagId=tagId, var=var:
-                                   cls.itemconfig(tagId, {opt: var.get()}))
-            _all_traces_colorvar[(self, (opt, tagId))] = (var, cbname)
-            _all_traces_colorvar.pop((self, (opt, None)))
+    for opt, var in pending:
+        _colorvar_traces.add(self, (opt, tagId), var)
     return tagId
 
 
 def _options(self, cnf, kw=None):
-    """Internal function."""
+    """Internal function. The stock `Misc._options` which also looks for
+    a Variable among the color options, about 10% slower than stock."""
     if kw:
         cnf = _TK._cnfmerge((cnf, kw))
     else:
         cnf = _TK._cnfmerge(cnf)
-
-    # ----------- Added the below block -------------
-    # Add the resources to the list to have ColorVar functionality.
-    # It'll work as long as it's not an item of canvas or mark_tag of text.
-    for i in ('fg', 'foreground', 'bg', 'background',
-              'activebackground', 'activeforeground', 'disabledforeground',
-              'highlightbackground', 'highlightcolor', 'selectforeground',
-              'readonlybackground', 'selectbackground', 'insertbackground',
-              'disabledbackground', 'fill'):
-        if isinstance(cnf.get(i), _TK.Variable):
-            var = cnf[i]
-            if not isinstance(self, tkmacosx.Button) and cnf.get('fill'):
-                continue
-            elif isinstance(self, tkmacosx.Button) and cnf.get('fill'):
-                i = 'fg'
-            cbname = var.trace_add('write', lambda *a, i=i, var=var,
-                                   cls=self: cls.config({i: var.get()}))
-            if (self, i) in _all_traces_colorvar:
-                v, cb = _all_traces_colorvar.get((self, i))
-                v.trace_remove('write', cb)
-                _all_traces_colorvar[(self, i)] = (var, cbname)
-            else:
-                _all_traces_colorvar[(self, i)] = (var, cbname)
-            if isinstance(self, tkmacosx.Button) and cnf.get('fill'):
-                i = 'fill'
-            cnf[i] = var.get()
-    # -----------------------------------------------
     res = ()
+    found = ()
     for k, v in cnf.items():
         if v is not None:
             if k[-1] == '_':
@@ -156,13 +423,108 @@ def _options(self, cnf, kw=None):
                         break
                 else:
                     v = ' '.join(nv)
+            # ----------- Added the below block -------------
+            elif isinstance(v, _Variable) and k in _WIDGET_COLOR_KEYS:
+                found += ((k, v),)
+            # -----------------------------------------------
             res = res + ('-'+k, v)
+    if found:
+        res = _apply_colorvars(self, cnf, found, res)
     return res
 
 
-_TK.Misc._options = _options
-_TK.Canvas._create = _create
-_TK.Misc._configure = _configure
+def _apply_colorvars(self, cnf, found, res):
+    """Internal function. Add the resources of `found` (option, Variable)
+    to have ColorVar functionality and put their values in the options
+    `res`. It'll work as long as it's not an item of canvas or mark_tag
+    of text."""
+    if not _colorvar_applies(self):
+        return res
+    button = isinstance(self, tkmacosx.Button)
+    values = {}
+    for i, var in found:
+        if not button and cnf.get('fill'):
+            continue
+        elif button and cnf.get('fill'):
+            i = 'fg'
+        _colorvar_traces.add(self, i, var)
+        if button and cnf.get('fill'):
+            i = 'fill'
+        values['-'+i] = cnf[i] = var.get()
+    res = list(res)
+    for j in range(0, len(res), 2):
+        if res[j] in values:
+            res[j+1] = values[res[j]]
+    return tuple(res)
+
+
+# Easing functions of ColorVar.animate_to, they work on arrays of 0 to 1.
+_EASINGS = {
+    'linear':       lambda t: t,
+    'ease-in':      lambda t: t*t,
+    'ease-out':     lambda t: 1 - (1-t)*(1-t),
+    'ease-in-out':  lambda t: t*t*(3 - 2*t),
+}
+
+
+class _FrameClock:
+    """Internal class. Runs all the color tweens of a Tk interpreter from a
+    single timer, one callback per frame for any number of variables."""
+
+    interval = 16   # ms
+
+    def __init__(self, root):
+        # Weak, `_frame_clocks` is keyed by the root.
+        self._root = weakref.ref(root)
+        self.tweens = {}  # Tcl variable name -> [steps, start, duration, index]
+        self._after_id = None
+
+    @property
+    def root(self):
+        "Tk root of the clock."
+        return self._root()
+
+    @classmethod
+    def of(cls, root):
+        """Return the clock of `root`, create it if needed."""
+        clock = _frame_clocks.get(root)
+        if clock is None:
+            clock = _frame_clocks[root] = cls(root)
+        return clock
+
+    def add(self, name, steps, duration):
+        """Play the HEX `steps` on the variable `name` in `duration` ms.
+        A tween already running on it is replaced."""
+        self.tweens[name] = [steps, time.perf_counter(), duration/1000.0, 0]
+        if self._after_id is None:
+            self._after_id = self.root.after(self.interval, self._tick)
+
+    def cancel(self, name):
+        """Stop the tween of the variable `name`."""
+        self.tweens.pop(name, None)
+        if not self.tweens and self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _tick(self):
+        "Internal function."
+        self._after_id = None
+        now = time.perf_counter()
+        for name, tween in list(self.tweens.items()):
+            steps, start, duration, index = tween
+            last = len(steps) - 1
+            new = min(last, int((now-start) / duration * last + 0.5))
+            if new != index:
+                tween[3] = new
+                self.root.globalsetvar(name, steps[new])
+            if new == last:
+                self.tweens.pop(name, None)
+        if self.tweens:
+            self._after_id = self.root.after(self.interval, self._tick)
+
+
+# Tk root  ---->  _FrameClock
+_frame_clocks = weakref.WeakKeyDictionary()
 
 
 class ColorVar(_TK.Variable):
@@ -181,24 +543,80 @@ class ColorVar(_TK.Variable):
         If NAME matches an existing variable and VALUE is omitted
         then the existing value is retained.
         """
+        if _colorvar_scope['enabled']:
+            _install_patches()
         super(ColorVar, self).__init__(master, value, name)
 
-    def set(self, value=''):
-        """Set the variable to VALUE."""
+    @classmethod
+    def normalize(cls, value, master=None):
+        """Return the HEX of a color name, a HEX is returned as it is.
+        Raises ValueError for an invalid color.
+
+        Names are looked up in the color tables of tkmacosx so no Tk
+        interpreter is needed, only unknown names are asked to Tk
+        through MASTER or the default root. No Tk root is ever made, an
+        unknown name without both raises ValueError."""
         if value.startswith('#'):
-            if not bool(self._rgbstring.match(value)):
+            if not bool(cls._rgbstring.match(value)):
                 raise ValueError('{} is not a vaild HEX.'.format(value))
-        elif isinstance(value, str):
-            try:
-                r, g, b = self._root.winfo_rgb(value)
-                c = (r/257, g/257, b/257)
-                value = '#%02x%02x%02x' % (int(c[0]), int(c[1]), int(c[2]))
-            except:
-                raise ValueError(
-                    'Could not find right HEX for "{}".'.format(value))
+            return value
+        try:
+            c = _get_rgb(value, master, new_root=False)
+        except Exception:
+            raise ValueError(
+                'Could not find right HEX for "{}".'.format(value))
+        return '#%02x%02x%02x' % (int(c[0]), int(c[1]), int(c[2]))
+
+    def set(self, value=''):
+        """Set the variable to VALUE. Stops the running `animate_to`."""
+        if isinstance(value, str):
+            value = self.normalize(value, self._root)
+        self.cancel_animation()
         return self._tk.globalsetvar(self._name, value)
     initialize = set
 
+    def animate_to(self, target, duration=300, easing='linear', space='rgb'):
+        """Change the color smoothly from the current to `target` color.
+
+        ### Args:
+        - `target`: Color name or HEX.
+        - `duration`: Duration of the animation (in ms).
+        - `easing`: 'linear', 'ease-in', 'ease-out', 'ease-in-out' or a \
+                function taking and returning a numpy array of 0 to 1.
+        - `space`: Interpolate in 'rgb' or 'hsl'.
+
+        Calling it again while animating retargets from the current color.
+        All the animations of an interpreter run on one shared timer."""
+        if isinstance(easing, str) and easing not in _EASINGS:
+            raise ValueError('Invalid easing "{}"'.format(easing))
+        if space not in ('rgb', 'hsl'):
+            raise ValueError('Invalid space "{}"'.format(space))
+        ease = _EASINGS[easing] if isinstance(easing, str) else easing
+        target = self.normalize(target, self._root)
+        if duration <= 0:
+            return self.set(target)
+        ends = np.array([_get_rgb(self.get(), self._root),
+                         _get_rgb(target, self._root)], dtype=float) / 255
+        if space == 'hsl':
+            ends = _rgb_to_hsl(ends)
+        frames = max(1, int(round(duration / _FrameClock.interval)))
+        t = ease(np.linspace(0.0, 1.0, frames + 1))[:, None]
+        steps = ends[0] + (ends[1]-ends[0])*t
+        if space == 'hsl':
+            steps = _hsl_to_rgb(steps)
+        rgb = np.clip(np.round(steps*255), 0, 255).astype(int)
+        hexes = np.char.add(np.char.add(np.char.add('#',
+            _hex_digits[rgb[:, 0]]), _hex_digits[rgb[:, 1]]), _hex_digits[rgb[:, 2]])
+        hexes = hexes.tolist()
+        hexes[-1] = target
+        _FrameClock.of(self._root).add(self._name, hexes, duration)
+
+    def cancel_animation(self):
+        """Stop the animation of the variable at its current color."""
+        clock = _frame_clocks.get(self._root)
+        if clock is not None:
+            clock.cancel(self._name)
+
     def get(self):
         """Return value of variable color."""
         value = self._tk.globalgetvar(self._name)
@@ -207,14 +625,32 @@ class ColorVar(_TK.Variable):
         return str(value)
 
 
+class _Missing:
+    "Internal class. Old or new value of a key which was added or removed."
+    def __repr__(self):
+        return 'MISSING'
+    def __bool__(self):
+        return False
+    def __reduce__(self):
+        return 'MISSING'
+
+
+MISSING = _Missing()
+
+
 class DictVar(_TK.Variable):
     """
     #### Value holder for Dictionaries.
     Get a specific value by getting the key from this \
     `get(self, key=None, d=None)` method if exists in the dictionary. \n
     if `key=None` it will returrn the complete dictionory.
+
+    Keys can be changed with `set_key`, `update` and `pop`. The changes are
+    written to Tcl together on idle (or with `flush`) and callbacks added
+    with `trace_keys` receive only the keys which changed.
     """
     _default = {}
+    MISSING = MISSING
 
     def __init__(self, master=None, value=None, name=None):
         """Construct a string variable.
@@ -226,21 +662,585 @@ class DictVar(_TK.Variable):
         If NAME matches an existing variable and VALUE is omitted
         then the existing value is retained.
         """
+        self._cache = None
+        self._changes = {}      # key -> (old, new)
+        self._flush_id = None
+        self._key_traces = {}   # cbname -> (callback, keys)
         _TK.Variable.__init__(self, master, value, name)
+        # The parsed value is kept until the Tcl variable is written.
+        ref = weakref.ref(self)
+        def invalidate(*args):
+            var = ref()
+            if var is not None:
+                var._cache = None
+        self.trace_add('write', invalidate)
+
+    def _parsed(self):
+        "Internal function. Returns the cached dictionary."
+        if self._cache is None:
+            value = self._tk.globalgetvar(self._name)
+            if not isinstance(value, dict):
+                value = ast.literal_eval(value)
+            self._cache = value
+        return self._cache
 
     def get(self, key=None, d=None):
         """Return value of variable as string."""
-        value = self._tk.globalgetvar(self._name)
-        if not isinstance(value, dict):
-            value = ast.literal_eval(value)
+        value = self._parsed()
         if key:
             return value.get(key, d)
         else:
-            return value
+            return dict(value)
+
+    def keys(self):
+        """Return a view of the keys of the dictionary."""
+        return self._parsed().keys()
+
+    def values(self):
+        """Return a view of the values of the dictionary."""
+        return self._parsed().values()
+
+    def items(self):
+        """Return a view of the items of the dictionary."""
+        return self._parsed().items()
+
+    def set(self, value):
+        """Set the variable to VALUE. Pending changes are dropped."""
+        if self._flush_id is not None:
+            self._root.after_cancel(self._flush_id)
+            self._flush_id = None
+        if self._key_traces:
+            old = self._parsed()
+            new = value if isinstance(value, dict) else ast.literal_eval(value)
+            for key in set(old) | set(new):
+                self._add_change(key, old.get(key, MISSING), new.get(key, MISSING))
+        self._cache = None
+        res = _TK.Variable.set(self, value)
+        self._notify()
+        return res
+    initialize = set
 
+    def set_key(self, key, value):
+        """Set `key` to `value`."""
+        value_ = self._parsed()
+        self._add_change(key, value_.get(key, MISSING), value)
+        value_[key] = value
+        self._schedule()
 
-def SaveVar(var: _TK.Variable, master=None, value=None, name=None, filename='data.pkl') \
-        -> (_TK.Variable):
+    def update(self, other=(), **kw):
+        """Update the dictionary from `other` and `kw` like `dict.update`."""
+        value = self._parsed()
+        for key, new in dict(other, **kw).items():
+            self._add_change(key, value.get(key, MISSING), new)
+            value[key] = new
+        self._schedule()
+
+    def pop(self, key, d=MISSING):
+        """Remove `key` and return its value, or `d` if it is not in
+        the dictionary. Raises KeyError if `d` is not given."""
+        value = self._parsed()
+        if key not in value:
+            if d is MISSING:
+                raise KeyError(key)
+            return d
+        old = value.pop(key)
+        self._add_change(key, old, MISSING)
+        self._schedule()
+        return old
+
+    def flush(self):
+        """Write the pending changes to Tcl now and notify `trace_keys`
+        callbacks."""
+        if self._flush_id is not None:
+            self._root.after_cancel(self._flush_id)
+            self._flush_id = None
+        if not self._changes: return
+        value = self._parsed()
+        for key, (old, new) in self._changes.items():
+            if new is MISSING:
+                value.pop(key, None)
+            else:
+                value[key] = new
+        _TK.Variable.set(self, value)
+        self._cache = value
+        self._notify()
+
+    def trace_keys(self, callback, keys=None):
+        """Call `callback(diff)` when keys are changed with `set_key`,
+        `update`, `pop` or `set`. `diff` is `{key: (old, new)}` where old
+        or new is `DictVar.MISSING` for added or removed keys. If `keys`
+        is given only the changes of these keys are sent.
+
+        Return the name of the callback."""
+        cbname = '%s_keys%d' % (self._name, id(callback))
+        self._key_traces[cbname] = (callback,
+            None if keys is None else frozenset(keys))
+        return cbname
+
+    def trace_keys_remove(self, cbname):
+        """Remove the `trace_keys` callback `cbname`."""
+        self._key_traces.pop(cbname, None)
+
+    def _add_change(self, key, old, new):
+        "Internal function. Merge a change with the pending ones."
+        if key in self._changes:
+            old = self._changes[key][0]
+        if old is new or (old is not MISSING and new is not MISSING and old == new):
+            self._changes.pop(key, None)
+        else:
+            self._changes[key] = (old, new)
+
+    def _schedule(self):
+        "Internal function. Flush the changes on idle."
+        if self._flush_id is None and self._changes:
+            self._flush_id = self._root.after_idle(self.flush)
+
+    def _notify(self):
+        "Internal function. Send the changes to `trace_keys` callbacks."
+        changes, self._changes = self._changes, {}
+        if not changes: return
+        for callback, keys in list(self._key_traces.values()):
+            if keys is None:
+                diff = dict(changes)
+            else:
+                diff = { k: changes[k] for k in keys.intersection(changes) }
+            if diff:
+                callback(diff)
+
+
+def _atomic_dump(filename, *objs):
+    """Internal function. Pickle `objs` one after the other to a temporary
+    file and move it in place of `filename`, so the file is never left
+    half written."""
+    # Made with mode 0666 like open() does, the umask applies to it.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    while True:
+        tmp = os.path.join(os.path.dirname(filename),
+                           '.savevar' + os.urandom(6).hex())
+        try:
+            fd = os.open(tmp, flags, 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for obj in objs:
+                pkl.dump(obj, f)
+        if os.path.exists(filename):
+            os.chmod(tmp, os.stat(filename).st_mode & 0o777)
+        os.replace(tmp, filename)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+@contextmanager
+def _file_lock(filename):
+    """Internal function. Hold an advisory lock on `filename`.lock so
+    processes sharing the file use it one at a time. Does nothing (and
+    makes no lock file) where fcntl is missing, like on Windows."""
+    if fcntl is None:
+        yield
+        return
+    with open(filename + '.lock', 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _apply_keys(target, data, keys):
+    "Internal function. Copy `keys` of `data` to `target`, remove missing ones."
+    for key in keys:
+        if key in data:
+            target[key] = data[key]
+        else:
+            target.pop(key, None)
+    return target
+
+
+class _PickleBackend:
+    """Internal class. The whole dictionary in one pickle file, rewritten
+    on every flush. The format of the old SaveVar files."""
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    def load(self):
+        "Return the dictionary of the file."
+        try:
+            with open(self.filename, 'rb') as f:
+                return pkl.load(f)
+        except Exception:
+            return {}
+
+    def write(self, data, keys):
+        """Write the `keys` changed in `data`, merged with the file as it
+        is now. Return the merged dictionary."""
+        merged = _apply_keys(self.load(), data, keys)
+        _atomic_dump(self.filename, merged)
+        return merged
+
+    def close(self):
+        pass
+
+
+class _JournalBackend(_PickleBackend):
+    """Internal class. Changes are appended to the file as (key, value)
+    pickles, the last one of a key wins. The file is compacted to one
+    record per key when it holds `compact` times more records than keys."""
+
+    compact = 4
+
+    def __init__(self, filename):
+        super(_JournalBackend, self).__init__(filename)
+        self.records = 0
+
+    def load(self):
+        data = {}
+        self.records = 0
+        try:
+            with open(self.filename, 'rb') as f:
+                while True:
+                    try:
+                        key, value = pkl.load(f)
+                    except EOFError:
+                        break
+                    except Exception:
+                        break   # Half written record at the end.
+                    if value is MISSING:
+                        data.pop(key, None)
+                    else:
+                        data[key] = value
+                    self.records += 1
+        except OSError:
+            pass
+        return data
+
+    def write(self, data, keys):
+        with open(self.filename, 'ab') as f:
+            for key in keys:
+                pkl.dump((key, data.get(key, MISSING)), f)
+        self.records += len(keys)
+        if self.records > self.compact * max(len(data), 16):
+            # Other processes may have appended, compact what is on disk.
+            merged = self.load()
+            _atomic_dump(self.filename, *merged.items())
+            self.records = len(merged)
+            return merged
+
+
+class _DbmBackend:
+    """Internal class. Keys stored in a `dbm` database, only the changed
+    keys are written. The database is opened for every read and write
+    (under the lock of the SaveStore), some dbm modules keep their index
+    in memory and would not see the writes of other processes."""
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    def load(self):
+        "Keys are read one at a time with `read`."
+        return None
+
+    def _open(self):
+        "Internal function."
+        import dbm
+        return dbm.open(self.filename, 'c')
+
+    def read(self, key):
+        "Return the value of `key` or MISSING."
+        with self._open() as db:
+            try:
+                return pkl.loads(db[key])
+            except KeyError:
+                return MISSING
+
+    def write(self, data, keys):
+        with self._open() as db:
+            for key in keys:
+                if key in data:
+                    db[key] = pkl.dumps(data[key])
+                elif key in db:
+                    del db[key]
+
+    def close(self):
+        pass
+
+
+class _SqliteBackend:
+    """Internal class. Keys stored in a `sqlite3` table, only the changed
+    keys are written in one transaction. The connection is kept open,
+    sqlite sees the changes of other processes."""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._db = None
+
+    @property
+    def db(self):
+        "The open connection."
+        if self._db is None:
+            import sqlite3
+            self._db = sqlite3.connect(self.filename)
+            self._db.execute('CREATE TABLE IF NOT EXISTS savevar '
+                             '(key TEXT PRIMARY KEY, value BLOB)')
+        return self._db
+
+    def load(self):
+        "Keys are read one at a time with `read`."
+        return None
+
+    def read(self, key):
+        row = self.db.execute('SELECT value FROM savevar WHERE key=?',
+                              (key,)).fetchone()
+        return MISSING if row is None else pkl.loads(row[0])
+
+    def write(self, data, keys):
+        with self.db:
+            self.db.executemany('INSERT OR REPLACE INTO savevar VALUES (?, ?)',
+                [(k, pkl.dumps(data[k])) for k in keys if k in data])
+            self.db.executemany('DELETE FROM savevar WHERE key=?',
+                [(k,) for k in keys if k not in data])
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+_backends = {
+    'pickle':   _PickleBackend,
+    'journal':  _JournalBackend,
+    'dbm':      _DbmBackend,
+    'sqlite':   _SqliteBackend,
+}
+
+
+class SaveStore:
+    """
+    ### Save file shared by many SaveVar.
+    Keeps the values of the file in memory, loaded on first access, and
+    writes the changed keys back some time after the last change. Pending
+    changes are also written at exit or with `flush`.
+
+    ### Args:
+    - `filename`: Name of the save file.
+    - `backend`: How the file is stored.
+        - 'pickle': One pickle of all the keys, rewritten on every save.
+        - 'journal': Changes are appended, compacted from time to time.
+        - 'dbm' or 'sqlite': Database, only changed keys are written. \
+            Good for thousands of keys.
+        - Or an object with `load`, `write` and `close` methods (and \
+            `read` if `load` returns None).
+    - `debounce`: Delay after the last change before writing (in ms).
+
+    Reads and writes hold an advisory lock on `filename`.lock and only the
+    keys changed by this process are written over the file, so processes
+    sharing a file don't overwrite each other. The lock file is left next
+    to the save file (it is not made where fcntl is missing, like on
+    Windows, and then there is no locking). Call `watch` to load the
+    changes made by other processes into the bound variables.
+
+    ### Example:
+        store = SaveStore('.settings.db', backend='sqlite')
+        var1 = SaveVar(tk.StringVar, root, 'Enter Username', 'Var1', store=store)
+        var2 = SaveVar(tk.StringVar, root, 'Enter Password', 'Var2', store=store)
+    """
+
+    def __init__(self, filename, backend='pickle', debounce=500):
+        self.filename = os.path.abspath(filename)
+        self.backend = _backends[backend](self.filename) \
+            if isinstance(backend, str) else backend
+        self.debounce = debounce
+        self._data = None
+        self._lazy = False
+        self._dirty = set()
+        self._after = None  # (root, after id)
+        self._bound = {}    # key -> weakref of the SaveVar
+        self._watch = None  # (root, interval, after id)
+        self._stat = None
+        _save_stores.append(self)
+
+    @classmethod
+    def of(cls, filename):
+        """Return the pickle store of `filename` shared by the SaveVar
+        given only a filename, create it if needed."""
+        filename = os.path.abspath(filename)
+        store = _save_files.get(filename)
+        if store is None:
+            store = _save_files[filename] = cls(filename)
+        return store
+
+    @property
+    def data(self):
+        "Dictionary of the values read so far."
+        if self._data is None:
+            self._data = self.backend.load()
+            if self._data is None:
+                self._data = {}
+                self._lazy = True
+            else:
+                self._lazy = False
+        return self._data
+
+    def get(self, key, d=None):
+        """Return the value of `key` or `d`."""
+        data = self.data
+        if key not in data and self._lazy and key not in self._dirty:
+            with _file_lock(self.filename):
+                value = self.backend.read(key)
+            if value is MISSING:
+                return d
+            data[key] = value
+        return data.get(key, d)
+
+    def put(self, key, value, root=None, debounce=None):
+        """Set `key` to `value`. The file is written `debounce` ms (defaults
+        to the store's) after the last change, through the `after` of
+        `root`, or now if `root` is not given."""
+        if key in self.data and self.data[key] == value: return
+        self.data[key] = value
+        self._dirty.add(key)
+        self._schedule(root, debounce)
+
+    def pop(self, key, root=None, debounce=None):
+        """Remove `key` and return its value or None."""
+        value = self.get(key)
+        if self.data.pop(key, MISSING) is not MISSING or self._lazy:
+            self._dirty.add(key)
+            self._schedule(root, debounce)
+        return value
+
+    def flush(self):
+        """Write the pending changes to the file now."""
+        self._cancel()
+        if not self._dirty: return
+        with _file_lock(self.filename):
+            merged = self.backend.write(self._data, self._dirty)
+            self._stat = self._file_stat()
+        if merged is not None:
+            self._data = merged
+        self._dirty = set()
+
+    def close(self):
+        """Write the pending changes and close the file."""
+        self.unwatch()
+        self.flush()
+        self.backend.close()
+
+    def bind(self, key, var):
+        """Set `var` to the new value of `key` when it is changed by
+        another process (see `watch`)."""
+        self._bound[key] = weakref.ref(var)
+
+    def watch(self, root, interval=1000):
+        """Check the file every `interval` ms with `os.stat`, through the
+        `after` of `root`, and reload it when another process changed it."""
+        self.unwatch()
+        self.data   # Load the file before taking its stat.
+        if self._stat is None:
+            self._stat = self._file_stat()
+        self._watch = (root, interval, root.after(interval, self._check))
+
+    def unwatch(self):
+        """Stop watching the file."""
+        if self._watch is not None:
+            root, interval, after_id = self._watch
+            self._watch = None
+            try:
+                root.after_cancel(after_id)
+            except _TK.TclError:
+                pass
+
+    def reload(self):
+        """Load the changes of other processes. Keys changed here and not
+        written yet are kept. The bound variables of changed keys are set."""
+        data = self.data
+        if self._lazy:
+            with _file_lock(self.filename):
+                new = { k: self.backend.read(k) for k in list(data) + list(self._bound) }
+            new = { k: v for k, v in new.items() if v is not MISSING }
+        else:
+            new = self.backend.load()
+        changed = { k for k in set(data) | set(new) if k not in self._dirty
+                    and data.get(k, MISSING) != new.get(k, MISSING) }
+        _apply_keys(data, new, changed)
+        self._stat = self._file_stat()
+        for key in changed:
+            ref = self._bound.get(key)
+            var = ref() if ref is not None else None
+            if var is not None and key in data:
+                var.set(data[key][0])
+
+    def _check(self):
+        "Internal function."
+        root, interval, after_id = self._watch
+        if self._file_stat() != self._stat:
+            self.reload()
+        try:
+            self._watch = (root, interval, root.after(interval, self._check))
+        except _TK.TclError:
+            self._watch = None
+
+    def _file_stat(self):
+        "Internal function. (mtime, size) of the file."
+        for path in (self.filename, self.filename+'.db', self.filename+'.dat'):
+            try:
+                st = os.stat(path)
+                return (st.st_mtime_ns, st.st_size)
+            except OSError:
+                pass
+
+    def _schedule(self, root, debounce):
+        "Internal function."
+        debounce = self.debounce if debounce is None else debounce
+        self._cancel()
+        if root is not None and debounce > 0:
+            try:
+                self._after = (root, root.after(debounce, self.flush))
+                return
+            except _TK.TclError:
+                pass
+        self.flush()
+
+    def _cancel(self):
+        "Internal function."
+        if self._after is not None:
+            root, after_id = self._after
+            self._after = None
+            try:
+                root.after_cancel(after_id)
+            except _TK.TclError:
+                pass
+
+
+# Absolute filename  ---->  SaveStore of SaveVar given only a filename
+_save_files = {}
+# Every SaveStore, written at exit.
+_save_stores = []
+
+
+def flush_savevar(filename=None):
+    """Write the pending changes of SaveVar to the file `filename` now,
+    or to all the files if `filename` is not given."""
+    saves = _save_stores
+    if filename is not None:
+        filename = os.path.abspath(filename)
+        saves = [s for s in saves if s.filename == filename]
+    for save in list(saves):
+        save.flush()
+
+
+atexit.register(flush_savevar)
+
+
+def SaveVar(var: _TK.Variable, master=None, value=None, name=None, filename='data.pkl',
+            debounce=None, store=None) -> (_TK.Variable):
     """Save tkinter variable data in a pickle file and load the 
     same value when the program is executed next time. 
 
@@ -255,6 +1255,13 @@ def SaveVar(var: _TK.Variable, master=None, value=None, name=None, filename='dat
     - `name`: Set a name to group variables or to refer to assigned value when loaded.
     - `filename`: Set the name of the save file. (To make the file invisible in the \
             directory start the name of the file with "." like ".cache-savevar")
+    - `debounce`: Delay after the last change before the file is written (in ms, \
+            500 by default). Pending changes are also written at exit or with \
+            `flush_savevar()`.
+    - `store`: Give a `SaveStore` to save in instead of `filename`.
+
+    A lock file named like the save file with ".lock" added is made next \
+    to it on systems with `fcntl` (see `SaveStore`).
 
     ### Return:
     - returns the tk.Variable instance passed to `var` argument.
@@ -269,35 +1276,21 @@ def SaveVar(var: _TK.Variable, master=None, value=None, name=None, filename='dat
 
     def update_val(*args):
         """Internal function for updating the value for variable"""
-        try:    # try/except , if the file doesn't exists.
-            open1 = open(filename, 'rb')
-            tmpdict = pkl.load(open1)  # load saved dictionary data.
-            # Block of code to check for the right value.
-            if tmpdict.get(str(var)):
-                old, default = tmpdict.get(str(var))
-                new = var.get()
-                if new != default:
-                    var.set(new)
-                elif new == default and not startup[0]:
-                    var.set(default)
-                else:
-                    var.set(old)
-            tmpdict.update({str(var): (var.get(), defaultval)})
-            open1.close()
-        except Exception as e:
-            tmpdict = {}
-            tmpdict[str(var)] = (var.get(), defaultval)
-
-        open2 = open(filename, 'wb')
-        pkl.dump(tmpdict, open2)
+        # Block of code to check for the right value.
+        if save.get(str(var)):
+            old, default = save.get(str(var))
+            if startup[0] and var.get() == default:
+                var.set(old)
+        save.put(str(var), (var.get(), defaultval), var._root, debounce)
         startup[0] = False
-        open2.close()
 
     startup = [True]
     if not(filename.endswith('.pickle') or filename.endswith('.pkl')) \
             and not filename.startswith('.'):
         filename = filename+'.pkl'
+    save = store if store is not None else SaveStore.of(filename)
     var = var(master=master, value=value, name=name)
+    save.bind(str(var), var)
     defaultval = var.get()  # get a default value of the variable
     update_val()
     for mode, cbname in (var.trace_info()):
@@ -325,13 +1318,56 @@ def demo_colorvar():
         if root.winfo_exists():
             if c >= len(color_list):
                 c = 0
-            color.set(color_list[c])
-            root.after(100, change_color, c+1)
+            color.animate_to(color_list[c], 400, 'ease-in-out', 'hsl')
+            root.after(500, change_color, c+1)
 
     change_color()
     root.mainloop()
 
 
+def bench_canvas_create(n=10000):
+    """Time creating `n` canvas items with the patched and with the stock
+    `Canvas._create`. Returns `{'tkmacosx': sec, 'tkinter': sec}`."""
+    import time
+    root = _TK.Tk()
+    canvas = _TK.Canvas(root)
+    color = ColorVar(root, 'red')
+    canvas.create_line(0, 0, 10, 10, fill=color)
+    res = {}
+    for name, create in (('tkmacosx', _create), ('tkinter', _stock_create)):
+        _TK.Canvas._create = create
+        try:
+            start = time.perf_counter()
+            for i in range(n):
+                canvas.create_line(i, 0, i, 10, fill='blue', width=1)
+            res[name] = time.perf_counter() - start
+        finally:
+            _TK.Canvas._create = _create
+        canvas.delete('all')
+    root.destroy()
+    return res
+
+
+def bench_options(n=100000):
+    """Time `n` calls of `Misc._options` with the patched and with the
+    stock function. Returns `{'tkmacosx': usec, 'tkinter': usec}` per call.
+    Without a Variable in the options the patched function is still about
+    10% slower than stock (with or without color options). Until a
+    ColorVar is made (or `enable_colorvar` is called) tkinter runs the
+    stock function."""
+    import time
+    root = _TK.Tcl()
+    cnf = {'text': 'Label', 'bg': 'red', 'fg': 'white', 'width': 10,
+           'relief': 'flat', 'padx': (2, 4)}
+    res = {}
+    for name, options in (('tkmacosx', _options), ('tkinter', _stock_options)):
+        start = time.perf_counter()
+        for _ in range(n):
+            options(root, cnf)
+        res[name] = (time.perf_counter() - start) / n * 1e6
+    return res
+
+
 def demo_savevar():
     root = _TK.Tk()
     var1 = SaveVar(_TK.StringVar, root, 'Enter Username',